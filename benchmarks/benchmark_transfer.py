@@ -0,0 +1,234 @@
+"""Benchmark for Transfer Vert Order addon transfer modes, runs in background blender:
+
+    blender -b --factory-startup --python benchmarks/benchmark_transfer.py -- --sizes 1000 100000 --output bench.json
+    blender -b --factory-startup --python benchmarks/benchmark_transfer.py -- --compare old.json new.json
+
+Every synthetic source mesh (subdivided grid, many small islands, mirrored UVs, n-gons) gets a scrambled
+copy as target - random vert/face permutation, rotated face corners and deformation. The scrambled copy
+remembers original vert/face index in integer attributes, so after the transfer the recovered fraction
+of the permutation is read back from them. Time is measured without tracing, peak python memory
+(tracemalloc) in a second run of the same case.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+
+import numpy as np
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import transfer_vertex_order  # noqa: E402
+from transfer_vertex_order import addon as vot, core  # noqa: E402
+
+
+def grid_shape(verts):
+    """Subdivided grid with about verts vertices: (co, loop_total, loop_verts, loop_uvs, spacing)"""
+    n = max(int(np.sqrt(verts)) - 1, 1)
+    x, y = np.meshgrid(np.arange(n + 1), np.arange(n + 1))
+    co = np.column_stack((x.ravel(), y.ravel(), np.zeros(x.size))) / n
+    a = (np.arange(n)[None, :] + (n + 1) * np.arange(n)[:, None]).ravel()
+    loop_verts = np.column_stack((a, a + 1, a + n + 2, a + n + 1)).ravel()
+    loop_total = np.full(n * n, 4)
+    return co, loop_total, loop_verts, co[loop_verts, :2].copy(), 1.0 / n
+
+
+def islands_shape(verts, island_size=10):
+    """Many small grid islands scattered on a plane"""
+    co, loop_total, loop_verts, loop_uvs, spacing = grid_shape((island_size + 1) ** 2)
+    count = max(verts // len(co), 1)
+    side = int(np.ceil(np.sqrt(count)))
+    offsets = np.column_stack((np.arange(count) % side, np.arange(count) // side, np.zeros(count))) * 1.5
+    all_co = (co[None] + offsets[:, None]).reshape(-1, 3) / side
+    all_loop_verts = (loop_verts[None] + len(co) * np.arange(count)[:, None]).ravel()
+    all_uvs = ((loop_uvs[None] + offsets[:, None, :2]) / (1.5 * side)).reshape(-1, 2)
+    return all_co, np.tile(loop_total, count), all_loop_verts, all_uvs, spacing / side
+
+
+def mirrored_uv_shape(verts):
+    """Grid where both halves share the same (mirrored) UVs"""
+    co, loop_total, loop_verts, loop_uvs, spacing = grid_shape(verts)
+    co[:, 0] = co[:, 0] * 2 - 1
+    loop_uvs = np.column_stack((np.abs(co[loop_verts, 0]), co[loop_verts, 1]))
+    return co, loop_total, loop_verts, loop_uvs, spacing * 2
+
+
+def ngon_shape(verts):
+    """Grid of hexagons - every two neighbour quads merged into one 6 sided polygon"""
+    n = max(int(np.sqrt(verts)) - 1, 2) // 2 * 2
+    co, _, _, _, spacing = grid_shape((n + 1) ** 2)
+    x = np.arange(0, n, 2)[None, :]
+    y = np.arange(n)[:, None]
+    a = (x + (n + 1) * y).ravel()
+    loop_verts = np.column_stack((a, a + 1, a + 2, a + n + 3, a + n + 2, a + n + 1)).ravel()
+    loop_total = np.full(len(a), 6)
+    return co, loop_total, loop_verts, co[loop_verts, :2].copy(), spacing
+
+
+SHAPES = {
+    "grid": grid_shape,
+    "islands": islands_shape,
+    "mirrored_uv": mirrored_uv_shape,
+    "ngons": ngon_shape,
+}
+
+
+def scramble(co, loop_total, loop_verts, loop_uvs, rng, deform):
+    """Randomly permuted copy: (co, loop_total, loop_verts, loop_uvs, source vert of each vert, source face of each face)"""
+    vert_order = rng.permutation(len(co))
+    new_vert = np.argsort(vert_order)
+    face_order = rng.permutation(len(loop_total))
+    loop_start = np.cumsum(loop_total) - loop_total
+    totals = loop_total[face_order]
+    ramp = np.arange(int(totals.sum())) - np.repeat(np.cumsum(totals) - totals, totals)
+    rotation = rng.integers(0, totals)
+    old_loops = np.repeat(loop_start[face_order], totals) + (ramp + np.repeat(rotation, totals)) % np.repeat(totals, totals)
+    return deform(co[vert_order]), totals, new_vert[loop_verts[old_loops]], loop_uvs[old_loops], vert_order, face_order
+
+
+def build_object(name, co, loop_total, loop_verts, loop_uvs, int_attributes=()):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts.astype(np.int32))
+    mesh.polygons.add(len(loop_total))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(loop_total) - loop_total).astype(np.int32))
+    if not bpy.types.MeshPolygon.bl_rna.properties["loop_total"].is_readonly:
+        mesh.polygons.foreach_set("loop_total", loop_total.astype(np.int32))
+    mesh.update(calc_edges=True)
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", loop_uvs.astype(np.float32).ravel())
+    for attr_name, domain, values in int_attributes:
+        mesh.attributes.new(attr_name, 'INT', domain).data.foreach_set("value", values.astype(np.int32))
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def recovered(obj, attr_name):
+    """Fraction of elements which got back their source index"""
+    data = obj.data.attributes[attr_name].data
+    values = np.empty(len(data), dtype=np.int32)
+    data.foreach_get("value", values)
+    return float(np.mean(values == np.arange(len(values)))) if len(values) else 1.0
+
+
+def recovered_loops(obj, src_loop_verts):
+    """Fraction of loops which have the same vert as source loop with the same index"""
+    loop_verts = np.empty(len(obj.data.loops), dtype=np.int32)
+    obj.data.loops.foreach_get("vertex_index", loop_verts)
+    return float(np.mean(loop_verts == src_loop_verts)) if len(loop_verts) else 1.0
+
+
+def build_case(shape, size, mode, seed):
+    """(source, target, transfer options, source loop verts, vert count, face count) of one benchmark case.
+    Same arguments always build the same case - transfer changes target, so every run needs its own"""
+    co, loop_total, loop_verts, loop_uvs, spacing = SHAPES[shape](size)
+    rng = np.random.default_rng(seed)
+    if mode == "proximity":  # same shape, tiny noise
+        deform = lambda c: c + rng.normal(0, spacing * 0.02, c.shape)
+        options = {"delta": spacing * 0.4}
+    else:  # different shape, same uvs/topology
+        deform = lambda c: c + np.column_stack((np.zeros((len(c), 2)), 0.2 * np.sin(c[:, 0] * 6) * np.cos(c[:, 1] * 4)))
+        options = {"delta": spacing * 0.25} if mode == "uv" else {"delta": spacing * 0.5} if mode == "hybrid" else {}
+    source = build_object("bench_source", co, loop_total, loop_verts, loop_uvs)
+    t_co, t_total, t_verts, t_uvs, src_vert, src_face = scramble(co, loop_total, loop_verts, loop_uvs, rng, deform)
+    target = build_object("bench_target", t_co, t_total, t_verts, t_uvs,
+                          (("bench_src_vert", 'POINT', src_vert), ("bench_src_face", 'FACE', src_face)))
+    return source, target, options, loop_verts, len(co), len(loop_total)
+
+
+def remove_objects(*objects):
+    for obj in objects:
+        mesh = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+
+def run_case(shape, size, mode, seed, memory=True):
+    transfer = vot.TRANSFER_MODES[mode.upper()]
+    source, target, options, loop_verts, vert_count, face_count = build_case(shape, size, mode, seed)
+    start_time = time.perf_counter()
+    transfer(source, [target], **options)
+    seconds = time.perf_counter() - start_time
+    result = {
+        "shape": shape, "mode": mode, "size": size,
+        "verts": vert_count, "faces": face_count,
+        "seconds": round(seconds, 4),
+        "peak_python_mb": None,
+        "recovered_verts": round(recovered(target, "bench_src_vert"), 6),
+        "recovered_faces": round(recovered(target, "bench_src_face"), 6),
+        "recovered_loops": round(recovered_loops(target, loop_verts), 6),
+    }
+    remove_objects(source, target)
+
+    if memory:  # tracing slows python code a lot more than numpy, so memory gets its own untimed run
+        source, target, options, _, _, _ = build_case(shape, size, mode, seed)
+        tracemalloc.start()
+        transfer(source, [target], **options)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        remove_objects(source, target)
+        result["peak_python_mb"] = round(peak / 2 ** 20, 2)
+    return result
+
+
+def compare(old_path, new_path):
+    """Print time ratio and recovery change of matching cases of two benchmark outputs"""
+    with open(old_path) as f:
+        old = {(r["shape"], r["mode"], r["size"]): r for r in json.load(f)["results"]}
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+    print("%-12s %-10s %9s %10s %10s %7s %9s" % ("shape", "mode", "size", "old s", "new s", "ratio", "recovery"))
+    for r in new:
+        o = old.get((r["shape"], r["mode"], r["size"]))
+        if o is None:
+            continue
+        ratio = r["seconds"] / o["seconds"] if o["seconds"] else float("nan")
+        recovery = r["recovered_verts"] - o["recovered_verts"]
+        print("%-12s %-10s %9d %10.3f %10.3f %7.2f %+9.4f" % (r["shape"], r["mode"], r["size"], o["seconds"], r["seconds"], ratio, recovery))
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="blender -b --python benchmarks/benchmark_transfer.py --")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000, 5000000], help="Approximate vertex counts")
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument("--modes", nargs="+", choices=[mode.lower() for mode in vot.TRANSFER_MODES], default=[mode.lower() for mode in vot.TRANSFER_MODES])
+    parser.add_argument("--max-topology-size", type=int, default=1000000, help="Skip topology mode above this size (python flood fill)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="Skip second run of each case measuring peak python memory")
+    parser.add_argument("--output", help="Write json results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files instead of running")
+    args = parser.parse_args(argv)
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    results = []
+    for size in args.sizes:
+        for shape in args.shapes:
+            for mode in args.modes:
+                if mode == "topology" and size > args.max_topology_size:
+                    continue
+                result = run_case(shape, size, mode, args.seed, not args.no_memory)
+                print("%(shape)-12s %(mode)-10s %(verts)9d verts %(seconds)9.3fs  recovered %(recovered_verts).4f" % result)
+                results.append(result)
+
+    output = {
+        "addon_version": list(transfer_vertex_order.bl_info["version"]),
+        "blender": bpy.app.version_string,
+        "scipy": core.cKDTree is not None,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
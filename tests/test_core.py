@@ -0,0 +1,191 @@
+"""Headless tests of transfer_vertex_order.core on small fixture meshes (numpy only, no blender needed).
+Run with: python -m pytest tests"""
+import time
+
+import numpy as np
+import pytest
+
+from transfer_vertex_order import core
+
+
+def grid(n, offset=(0.0, 0.0)):
+    """n x n quad grid: (co, loop_total, loop_verts)"""
+    co = np.array([(x + offset[0], y + offset[1], 0.0) for y in range(n + 1) for x in range(n + 1)])
+    a = (np.arange(n)[None, :] + (n + 1) * np.arange(n)[:, None]).ravel()
+    return co, np.full(len(a), 4), np.column_stack((a, a + 1, a + n + 2, a + n + 1)).ravel()
+
+
+def grid_mesh(n=6):
+    co, loop_total, loop_verts = grid(n)
+    return core.mesh_from_polygons(co, loop_total, loop_verts, co[loop_verts, :2] * 0.1)
+
+
+def islands_mesh():
+    """Two grids of different size, so islands have different topology"""
+    co, loop_total, loop_verts = grid(4)
+    co2, loop_total2, loop_verts2 = grid(3, (10.0, 0.0))
+    co = np.concatenate((co, co2))
+    loop_verts = np.concatenate((loop_verts, loop_verts2 + len(co) - len(co2)))
+    return core.mesh_from_polygons(co, np.concatenate((loop_total, loop_total2)), loop_verts, co[loop_verts, :2] * 0.1)
+
+
+def ngon_mesh(n=8):
+    """Rows of 6 sided polygons - neighbour rows share two edges"""
+    co = np.array([(x, y, 0.0) for y in range(n + 1) for x in range(n + 1)])
+    a = (np.arange(0, n, 2)[None, :] + (n + 1) * np.arange(n)[:, None]).ravel()
+    loop_verts = np.column_stack((a, a + 1, a + 2, a + n + 3, a + n + 2, a + n + 1)).ravel()
+    return core.mesh_from_polygons(co, np.full(len(a), 6), loop_verts, co[loop_verts, :2] * 0.1)
+
+
+def scramble(mesh, seed=0):
+    """Copy of mesh with permuted verts and faces and rotated polygon corners"""
+    rng = np.random.default_rng(seed)
+    vert_order = rng.permutation(len(mesh.co))
+    face_order = rng.permutation(len(mesh.loop_total))
+    totals = mesh.loop_total[face_order]
+    ramp = np.arange(int(totals.sum())) - np.repeat(np.cumsum(totals) - totals, totals)
+    rotation = rng.integers(0, totals)
+    old_loops = np.repeat(mesh.loop_start[face_order], totals) + (ramp + np.repeat(rotation, totals)) % np.repeat(totals, totals)
+    new_vert = np.argsort(vert_order)
+    return core.mesh_from_polygons(mesh.co[vert_order], totals, new_vert[mesh.loop_verts[old_loops]], mesh.uvs[old_loops])
+
+
+def reordered(mesh, vert_map, edge_map, face_map, rotation):
+    """mesh with elements moved the way the addon writes matched maps back"""
+    vert_ids, edge_ids, face_ids = (core.complete_index_map(id_map) for id_map in (vert_map, edge_map, face_map))
+    new_to_old_faces = core.invert_permutation(face_ids)
+    order, starts = core.corner_order(mesh.loop_start, mesh.loop_total, new_to_old_faces, rotation)
+    co = np.empty_like(mesh.co)
+    co[vert_ids] = mesh.co
+    edge_verts = np.empty_like(mesh.edge_verts)
+    edge_verts[edge_ids] = vert_ids[mesh.edge_verts]
+    return core.MeshArrays(co, edge_verts, starts, mesh.loop_total[new_to_old_faces],
+                           vert_ids[mesh.loop_verts[order]], edge_ids[mesh.loop_edges[order]])
+
+
+def assert_recovered(src, mesh, maps):
+    report = core.verify_topology(src, reordered(mesh, *maps[:4]))
+    assert core.verify_percentages(report) == (100.0, 100.0, 100.0)
+    assert report.mismatched_islands == []
+
+
+MATCHERS = {
+    "proximity": lambda src, mesh: core.match_by_proximity(src, mesh, 0.1),
+    "proximity_from_verts": lambda src, mesh: core.match_by_proximity(src, mesh, 0.1, derive_from_verts=True),
+    "proximity_one_to_one": lambda src, mesh: core.match_by_proximity(src, mesh, 0.1, candidates=4),
+    "uv": lambda src, mesh: core.match_by_uv(src, mesh, 0.001),
+    "topology": core.match_by_topology,
+    "hybrid": lambda src, mesh: core.match_by_hybrid(src, mesh, 0.1),
+}
+
+
+@pytest.mark.parametrize("matcher", MATCHERS)
+@pytest.mark.parametrize("fixture", [grid_mesh, islands_mesh, ngon_mesh])
+def test_matchers_recover_scrambled_order(matcher, fixture):
+    src = fixture()
+    mesh = scramble(src)
+    assert_recovered(src, mesh, MATCHERS[matcher](src, mesh))
+
+
+def test_topology_matches_ngons_against_itself():
+    src = ngon_mesh()
+    vert_map, edge_map, face_map, rotation, unmatched = core.match_by_topology(src, src)
+    assert unmatched == 0
+    assert np.array_equal(face_map, np.arange(len(src.loop_total)))
+
+
+@pytest.mark.parametrize("matcher", MATCHERS)
+@pytest.mark.parametrize("vert_count", [0, 5])
+def test_matchers_accept_meshes_without_faces(matcher, vert_count):
+    co = np.random.default_rng(0).random((vert_count, 3))
+    mesh = core.mesh_from_polygons(co, [], [], np.zeros((0, 2)))
+    maps = MATCHERS[matcher](mesh, mesh)
+    assert [len(id_map) for id_map in maps[:3]] == [vert_count, 0, 0]
+
+
+def test_spatial_index_empty():
+    index = core.SpatialIndex(np.zeros((0, 3)))
+    dist, found = index.query(np.zeros((0, 3)), 0.1)
+    assert len(found) == 0
+    dist, found = index.query(np.ones((2, 3)), 0.1)
+    assert found.tolist() == [-1, -1]
+
+
+def test_spatial_index_without_scipy_on_dense_mesh(monkeypatch):
+    """Numpy grid fallback (blender ships no scipy) at default delta, with search radius 30 vertex spacings"""
+    monkeypatch.setattr(core, "cKDTree", None)
+    co = grid(299)[0] / 299
+    index = core.SpatialIndex(co)
+    jitter = np.random.default_rng(0).uniform(-0.0008, 0.0008, co.shape) * [1, 1, 0]
+    start = time.perf_counter()
+    dist, found = index.query(co + jitter, 0.1)
+    assert time.perf_counter() - start < 5.0
+    assert np.array_equal(found, np.arange(len(co)))
+    dist, found = index.query_k(co[:1000], 4, 0.1)
+    assert np.array_equal(found[:, 0], np.arange(1000))
+
+
+def test_spatial_index_query_k_without_scipy(monkeypatch):
+    monkeypatch.setattr(core, "cKDTree", None)
+    rng = np.random.default_rng(0)
+    points, queries = rng.random((3000, 3)), rng.random((500, 3))
+    dist, found = core.SpatialIndex(points).query_k(queries, 4, 0.2)
+    all_dist = np.linalg.norm(queries[:, None] - points[None], axis=2)
+    nearest = np.argsort(all_dist, axis=1)[:, :4]
+    nearest[np.take_along_axis(all_dist, nearest, axis=1) >= 0.2] = -1
+    assert np.array_equal(found, nearest)
+    assert np.allclose(dist[found >= 0], np.take_along_axis(all_dist, nearest, axis=1)[found >= 0])
+
+
+@pytest.mark.parametrize("candidates", [0, 4])
+def test_proximity_stream_matches_in_memory(candidates):
+    src = islands_mesh()
+    mesh = scramble(src)
+    streamed = core.run_steps(core.proximity_stream_steps(src, core.proximity_indices(src), lambda name: getattr(mesh, name),
+                                                          0.1, chunk_size=7, candidates=candidates))
+    in_memory = core.match_by_proximity(src, mesh, 0.1, candidates=candidates)
+    for streamed_map, id_map in zip(streamed, in_memory):
+        assert np.array_equal(streamed_map, id_map)
+
+
+def test_repair_index_map_resolves_duplicates_and_out_of_range():
+    ids = core.repair_index_map([2, 2, 7, -1, 0], [True, True, False, False, False])
+    assert sorted(ids.tolist()) == [0, 1, 2, 3, 4]
+    assert ids[0] == 2  # first processed claim wins
+    assert ids[4] == 0  # not processed element keeps free id
+
+
+def test_complete_index_map_keeps_unmatched_in_place():
+    assert core.complete_index_map(np.array([1, 0, -1, -1])).tolist() == [1, 0, 2, 3]
+
+
+def test_face_islands_scrambled_strip():
+    count = 5000
+    rng = np.random.default_rng(0)
+    quads = np.array([[2 * i, 2 * i + 2, 2 * i + 3, 2 * i + 1] for i in range(count)])
+    mesh = core.mesh_from_polygons(np.zeros((2 * count + 2, 3)), np.full(count, 4), quads[rng.permutation(count)].ravel())
+    pairs, _ = core.face_adjacency(mesh.loop_total, mesh.loop_edges, len(mesh.edge_verts))
+    assert np.unique(core.face_islands(count, pairs)).tolist() == [0]
+    assert np.unique(core.island_numbers(islands_mesh())).tolist() == [0, 1]
+
+
+def test_verify_topology():
+    src = islands_mesh()
+    report = core.verify_topology(src, src)
+    assert core.verify_percentages(report) == (100.0, 100.0, 100.0)
+
+    # swap two verts of second island
+    perm = np.arange(len(src.co))
+    perm[[30, 31]] = [31, 30]
+    swapped = src._replace(loop_verts=perm[src.loop_verts].astype(np.int32), edge_verts=perm[src.edge_verts].astype(np.int32))
+    report = core.verify_topology(src, swapped)
+    assert report.verts < len(src.co)
+    assert [island for island, _, _ in report.mismatched_islands] == [1]
+
+    report = core.verify_topology(src, scramble(src))
+    assert report.faces < len(src.loop_total)
+
+
+def test_scoped_index_map_moves_only_region():
+    ids = core.scoped_index_map(np.array([5, 3, -1]), np.array([3, 4, 5]), 8)
+    assert ids.tolist() == [0, 1, 2, 5, 3, 4, 6, 7]
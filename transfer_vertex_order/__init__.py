@@ -0,0 +1,39 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+bl_info = {
+    "name": "Transfer Vert Order",
+    "author": "Jose Conseco based on UV Transfer from MagicUV Nutti",
+    "version": (2, 4),
+    "blender": (2, 82, 0),
+    "location": "Sidebar (N) -> Tools panel",
+    "description": "Transfer Verts IDs by verts proximity or by selected faces",
+    "warning": "",
+    "wiki_url": "",
+    "category": "Object",
+    }
+
+# matching itself lives in .core (numpy only), .addon adapts it to blender meshes, operators and UI.
+# Outside of blender (worker processes, scripts) only .core can be imported
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+if bpy is not None:
+    from .addon import register, unregister
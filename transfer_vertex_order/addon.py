@@ -0,0 +1,1569 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import struct
+import os
+import glob
+import re
+import json
+import time
+import subprocess
+import tempfile
+from array import array
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from functools import wraps
+
+import numpy as np
+import bpy
+import bmesh
+from bpy.props import BoolProperty,BoolProperty
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+
+from . import bl_info
+from .core import (
+    profiler, run_steps, scaled_steps, MeshArrays, LoopGraph, FloodFillError, flood_fill,
+    SourceIndexCache, content_fingerprint, complete_index_map, invert_permutation, corner_order,
+    topology_fingerprint, loop_ids_from_faces, loop_faces, corner_rotation, MeshIslands, topology_match,
+    face_center_index, hybrid_match, MemoryMeter, stream_chunk_size, stream_min_bytes, stream_resident_bytes,
+    indices_nbytes, reorder_nbytes, proximity_stream_steps, uv_stream_steps,
+    proximity_indices, proximity_match_steps, uv_indices, uv_match_steps, verify_topology, verify_summary_lines,
+    verify_percentages, island_numbers, region_from_faces, region_mesh, scoped_index_map,
+)
+
+
+class CopyIDs():
+    def __init__(self):
+        self.transuv = ID_DATA()
+        self.last_transfer = None  # VertexOrderMap of last reordered mesh
+
+class ID_DATA():
+    """Copied ids in flat arrays (CSR layout) - face j owns loop/vert/edge ids offsets[j]:offsets[j+1].
+    corner_ids is position of every copied loop inside its face, used to rotate pasted faces the same way.
+    Every copied island is one segment of the buffers - island k owns faces islands[k]:islands[k+1]"""
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self.faces_id)
+
+    @property
+    def island_count(self):
+        return len(self.islands) - 1
+
+    def clear(self):
+        self.faces_id = array('i')
+        self.offsets = array('i', [0])
+        self.loop_ids = array('i')
+        self.vert_ids = array('i')
+        self.edge_ids = array('i')
+        self.corner_ids = array('i')
+        self.islands = array('i', [0])
+
+    def add_island(self, parsed, corners):
+        """Append ParsedFaces arrays of one island as new buffer segment"""
+        loop_count = len(self.loop_ids)
+        self.faces_id.extend(parsed.faces)
+        self.offsets.frombytes((np.frombuffer(parsed.offsets, dtype=np.int32)[1:] + loop_count).tobytes())
+        self.loop_ids.extend(parsed.loops)
+        self.vert_ids.extend(parsed.verts)
+        self.edge_ids.extend(parsed.edges)
+        self.corner_ids.frombytes(np.asarray(corners, dtype=np.int32).tobytes())
+        self.islands.append(len(self.faces_id))
+
+    def island(self, k):
+        """Zero copy int32 views of island k segment: (face ids, offsets from 0, vert ids, edge ids, corner ids)"""
+        first, last = self.islands[k], self.islands[k + 1]
+        offsets = self.as_numpy("offsets")[first:last + 1]
+        loops = slice(int(offsets[0]), int(offsets[-1]))
+        return (self.as_numpy("faces_id")[first:last], offsets - offsets[0], self.as_numpy("vert_ids")[loops],
+                self.as_numpy("edge_ids")[loops], self.as_numpy("corner_ids")[loops])
+
+    def as_numpy(self, name):
+        """Zero copy int32 view of one of the buffers"""
+        return np.frombuffer(getattr(self, name), dtype=np.int32)
+
+
+def profile_trace_path(context):
+    """Trace file path when profiling is on (addon preference or VOT_PROFILE env var), else None.
+    VOT_PROFILE can be 1 or a trace file path"""
+    env = os.environ.get("VOT_PROFILE", "")
+    addon = context.preferences.addons.get(__package__)
+    prefs = addon.preferences if addon else None
+    if env in ("", "0") and not (prefs and prefs.use_profiling):
+        return None
+    if prefs and prefs.profile_trace_path:
+        return bpy.path.abspath(prefs.profile_trace_path)
+    if env not in ("", "0", "1"):
+        return env
+    return os.path.join(tempfile.gettempdir(), "vert_order_profile.json")
+
+
+def profiled(execute):
+    """Operator execute decorator - when profiling is on reports stage timings and writes trace file"""
+    @wraps(execute)
+    def wrapper(self, context):
+        trace_path = profile_trace_path(context)
+        if trace_path is None:
+            return execute(self, context)
+        profiler.start()
+        try:
+            return execute(self, context)
+        finally:
+            finish_profile(self, trace_path)
+    return wrapper
+
+
+def finish_profile(operator, trace_path):
+    """Stop profiler, report stage timings and write trace file"""
+    profiler.stop()
+    for line in profiler.summary_lines():
+        operator.report({'INFO'}, line)
+    try:
+        profiler.write_trace(trace_path)
+        operator.report({'INFO'}, 'Profile trace saved to '+trace_path)
+    except OSError as e:
+        operator.report({'WARNING'}, 'Could not save profile trace: '+str(e))
+
+
+class ModalSteps():
+    """Operator mixin running self.steps(context) - a generator yielding progress 0..1 and returning operator result.
+    invoke runs it in time budgeted chunks on timer events (UI stays responsive, progress bar in status bar),
+    Esc closes the generator which restores the mesh. execute (scripts, redo) runs all steps at once"""
+    time_budget = 0.05  # seconds of work per timer event
+    modal_chunk_size = 100000  # points per spatial query chunk
+    pass_through = {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM', 'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE'}
+
+    @profiled
+    def execute(self, context):
+        return run_steps(self.steps(context))
+
+    def invoke(self, context, event):
+        # profiling spans whole modal run, it is finished in _end (also on cancel and errors)
+        self._trace_path = profile_trace_path(context)
+        if self._trace_path is not None:
+            profiler.start()
+        self._steps = self.steps(context, self.modal_chunk_size)
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.001, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._steps.close()
+            self._end(context)
+            self.report({'WARNING'}, 'Cancelled, mesh order restored')
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            # only view navigation - editing mesh between chunks would invalidate read arrays
+            return {'PASS_THROUGH'} if event.type in self.pass_through else {'RUNNING_MODAL'}
+        deadline = time.perf_counter() + self.time_budget
+        try:
+            progress = next(self._steps)
+            while time.perf_counter() < deadline:
+                progress = next(self._steps)
+        except StopIteration as stop:
+            self._end(context)
+            return stop.value
+        except Exception:
+            self._end(context)
+            raise
+        context.window_manager.progress_update(int(progress * 100))
+        context.workspace.status_text_set(self.bl_label+': '+str(int(progress * 100))+'% (Esc to cancel)')
+        return {'RUNNING_MODAL'}
+
+    def _end(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        if self._trace_path is not None:
+            finish_profile(self, self._trace_path)
+
+
+class ScopedTransfer():
+    """Operator mixin with Scope property - limits matching and reorder to part of each target, rest keeps its order"""
+    scope: bpy.props.EnumProperty(name="Scope", description="Part of target meshes that is matched and reordered, rest of mesh keeps its order", items=(
+        ('ALL', "Whole Mesh", "Match and reorder whole target meshes"),
+        ('SELECTED', "Selected Faces", "Only selected faces of targets (with their verts and edges) are matched and reordered"),
+        ('ISLANDS', "Islands", "Only listed islands of targets are matched and reordered"),
+    ), default='ALL')
+    islands: bpy.props.StringProperty(name="Islands", description="Island numbers for Islands scope, e.g. 0, 3-5 (islands are numbered in order of their lowest face index, as listed by Verify vert order)", default="")
+
+    def transfer_scope(self):
+        """Scope function for transfer functions (None = whole mesh). Raises ValueError for invalid island numbers"""
+        return transfer_scope(self.scope, self.islands)
+
+
+class VOT_PT_CopyVertIds(bpy.types.Panel):
+    bl_idname = "VOT_PT_copyvertids"
+    bl_label = "Transfer vertex order"
+
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Tools'
+
+    def draw(self, context):
+        layout = self.layout
+        if context.mode == 'OBJECT':
+            layout.label(text = 'More options in Edit mode')
+            layout.operator("object.vert_id_transfer_proximity")
+            layout.operator("object.vert_id_transfer_uv")
+            layout.operator("object.vert_id_transfer_topology")
+            layout.operator("object.vert_id_transfer_hybrid")
+            layout.operator("object.vert_id_verify")
+
+            layout.separator()
+            layout.operator("object.vert_id_map_save")
+            layout.operator("object.vert_id_map_apply")
+
+        elif context.mode == 'EDIT_MESH':
+            layout.separator()
+            layout.operator("object.copy_vert_id")
+            layout.operator("object.paste_vert_id")
+
+
+class VOT_OT_TransferVertId(ScopedTransfer, ModalSteps, bpy.types.Operator):
+    """Transfer vert ID by vert proximity"""
+    bl_label = "Transfer IDs using location"
+    bl_idname = "object.vert_id_transfer_proximity"
+    bl_description = "Transfer verts IDs by vert positions (for meshes with exactly same shape)\nTwo mesh objects have to be selected"
+    bl_options = {'REGISTER'}
+
+    delta: bpy.props.FloatProperty(name="Delta", description="SearchDistance", default=0.1, min=0, max=1, precision = 4)
+    derive_from_verts: BoolProperty(name="Edges/Faces From Verts", description="Match only verts by position, edge and face order is derived from matched verts (faster, consistent with vert match)", default=False)
+    one_to_one: BoolProperty(name="One To One", description="Each source element is used at most once - mutual nearest pairs are matched first, so nearly coincident or noisy verts do not collapse onto one source vert", default=False)
+    candidates: bpy.props.IntProperty(name="Candidates", description="One To One: number of nearest source elements considered per target element", default=4, min=1, max=64)
+    sequence: BoolProperty(name="Sequence", description="Targets are frames of one mesh sequence with the same element order (ordered by name). Each frame reuses match of previous frame and only searches elements that moved further than Delta", default=False)
+    threads: bpy.props.IntProperty(name="Threads", description="Number of targets matched in parallel (0 = all CPU cores)", default=0, min=0)
+    max_memory: bpy.props.IntProperty(name="Memory Limit (MB)", description="Stream targets one at a time through queries sized to stay around this limit, for meshes that do not fit in memory (0 = off)", default=0, min=0)
+    def steps(self, context, chunk_size=0):
+        sourceObj = context.active_object
+        TargetObjs = [obj for obj in context.selected_objects if obj!=sourceObj and obj.type=='MESH']
+
+        if not TargetObjs:
+            self.report({'ERROR'}, 'You seed to select two mesh objects (source then target that will receive vert order)! Cancelling')
+            return {'CANCELLED'}
+
+        try:
+            scope = self.transfer_scope()
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        candidates = self.candidates if self.one_to_one else 0
+        results = yield from proximity_steps(sourceObj, TargetObjs, self.delta, self.derive_from_verts, self.threads, candidates, self.sequence, self.max_memory, scope, self, chunk_size)
+        report_transfer_results(self, context, results, sourceObj)
+        return {"FINISHED"}
+
+class VOT_OT_TransferVertIdByUV(ScopedTransfer, ModalSteps, bpy.types.Operator):
+    """Transfer vert ID by vert UVs"""
+    bl_label = "Transfer IDs using UVs"
+    bl_idname = "object.vert_id_transfer_uv"
+    bl_description = "Transfer verts IDs from selected to active object using UVs (for meshes with different shape but same UVs)\nTwo mesh objects have to be selected"
+    bl_options = {'REGISTER'}
+
+    delta: bpy.props.FloatProperty(name="Delta", description="SearchDistance", default=0.01, min=0, max=0.1, precision = 5)
+    uv_precision: bpy.props.FloatProperty(name="Exact UV Precision", description="Faces whose UV corners are equal at this precision are matched exactly, others are matched by UV center within Delta (0 = only by UV center)", default=0.00001, min=0, max=0.01, precision = 6)
+    threads: bpy.props.IntProperty(name="Threads", description="Number of targets matched in parallel (0 = all CPU cores)", default=0, min=0)
+    max_memory: bpy.props.IntProperty(name="Memory Limit (MB)", description="Stream targets one at a time through queries sized to stay around this limit, for meshes that do not fit in memory (0 = off)", default=0, min=0)
+    def steps(self, context, chunk_size=0):
+        sourceObj = context.active_object
+        TargetObjs = [obj for obj in context.selected_objects if obj!=sourceObj and obj.type=='MESH']
+
+        if not TargetObjs:
+            self.report({'ERROR'}, 'You seed to select two mesh objects (source then target that will receive vert order)! Cancelling')
+            return {'CANCELLED'}
+
+        try:
+            results = yield from uv_steps(sourceObj, TargetObjs, self.delta, self.threads, self.uv_precision, self.max_memory, self.transfer_scope(), self, chunk_size)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        report_transfer_results(self, context, results, sourceObj)
+        return {"FINISHED"}
+
+
+class VOT_OT_CopyVertID(bpy.types.Operator):
+    bl_idname = "object.copy_vert_id"
+    bl_label = "Copy Vert IDs"
+    bl_description = "Copy verts IDs by topology (you need to selected two faces, or pairs of faces one after another - one pair per island)\nMesh shape can be different, bu topology must be the same"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled
+    def execute(self, context):
+        props = context.scene.copy_indices.transuv
+        active_obj = context.active_object
+        self.obj = active_obj
+        bm = bmesh.from_edit_mesh(active_obj.data)
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+        bm.edges.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        props.clear()
+
+        # get selected faces - one pair per island
+        seed_pairs = selected_face_pairs(self, bm)
+        if seed_pairs is None:
+            return {'CANCELLED'}
+
+        # parse all faces of every island according to selection
+        with profiler.stage("flood fill", len(bm.faces), active_obj.name):
+            mesh = bmesh_mesh_arrays(bm)
+            graph = LoopGraph(mesh)
+            corners = loop_faces(mesh.loop_start, mesh.loop_total)[1]
+            copied = np.zeros(len(bm.faces), dtype=bool)
+            for sel_faces, active_face in seed_pairs:
+                if any(copied[face.index] for face in sel_faces):
+                    self.report({'WARNING'}, "Two face pairs are on the same island")
+                    props.clear()
+                    break
+                parsed = flood_fill_selected(self, bm, mesh, graph, sel_faces, active_face)
+                if not parsed:
+                    props.clear()
+                    break
+                copied[np.frombuffer(parsed.faces, dtype=np.int32)] = True
+                props.add_island(parsed, corners[np.frombuffer(parsed.loops, dtype=np.int32)])
+
+        bmesh.update_edit_mesh(active_obj.data)
+
+        return {'FINISHED'}
+
+
+class VOT_OT_PasteVertID(ModalSteps, bpy.types.Operator):
+    bl_idname = "object.paste_vert_id"
+    bl_label = "Paste verts Ids"
+    bl_description = "Paste verts ID by topology (you need selected two faces matching source obj topology, or one pair per copied island in the same order)\nMesh shape can be different, bu topology must be the same"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    invert_normals: BoolProperty(name="Invert Normals", description="Invert Normals", default=False)
+    only_pasted: BoolProperty(name="Keep Other Islands", description="Only pasted islands are reordered (between their own indices), rest of mesh keeps its order", default=False)
+
+    def steps(self, context, chunk_size=0):
+        props = context.scene.copy_indices.transuv
+        active_obj = context.active_object
+        bm = bmesh.from_edit_mesh(active_obj.data)
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+        bm.edges.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        # get selection history - pair k is pasted from copied island k (or all from the only copied island)
+        seed_pairs = selected_face_pairs(self, bm)
+        if seed_pairs is None:
+            return {'CANCELLED'}
+        if not props.island_count:
+            self.report({'WARNING'}, "Nothing to paste, copy vert IDs first")
+            return {'CANCELLED'}
+        if props.island_count not in (1, len(seed_pairs)):
+            self.report({'WARNING'}, str(props.island_count)+" islands were copied, but "+str(len(seed_pairs))+" face pairs are selected")
+            return {'CANCELLED'}
+
+        # parse selection history in one pass over all islands. -1 = not pasted
+        mesh = bmesh_mesh_arrays(bm)
+        graph = LoopGraph(mesh)
+        vert_ids = np.full(len(bm.verts), -1, dtype=np.int64)
+        edge_ids = np.full(len(bm.edges), -1, dtype=np.int64)
+        face_ids = np.full(len(bm.faces), -1, dtype=np.int64)
+        pasted_loops, pasted_corners = [], []
+        for i, (sel_faces, active_face) in enumerate(seed_pairs):
+            copied_faces, copied_offsets, copied_verts, copied_edges, copied_corners = props.island(i if props.island_count > 1 else 0)
+
+            # parse all faces according to selection history
+            with profiler.stage("flood fill", len(bm.faces), active_obj.name):
+                parsed = flood_fill_selected(self, bm, mesh, graph, sel_faces, active_face, self.invert_normals)
+            yield 0.8 * (i + 1) / len(seed_pairs)
+            if parsed:
+                # check amount of copied/pasted faces
+                if len(parsed) != len(copied_faces):
+                    self.report(
+                        {'WARNING'},
+                        "Mesh has different amount of faces"
+                    )
+                    return {'FINISHED'}
+
+                # check amount of copied/pasted verts
+                offsets = np.frombuffer(parsed.offsets, dtype=np.int32)
+                different = np.flatnonzero(np.diff(offsets) != np.diff(copied_offsets))
+                if len(different):
+                    bpy.ops.mesh.select_all(action='DESELECT')
+                    # select problematic face
+                    bm.faces[parsed.faces[different[0]]].select = True
+                    self.report(
+                        {'WARNING'},
+                        "Face have different amount of vertices"
+                    )
+                    return {'FINISHED'}
+
+                vert_ids[np.frombuffer(parsed.verts, dtype=np.int32)] = copied_verts
+                edge_ids[np.frombuffer(parsed.edges, dtype=np.int32)] = copied_edges
+                face_ids[np.frombuffer(parsed.faces, dtype=np.int32)] = copied_faces
+                pasted_loops.append(np.frombuffer(parsed.loops, dtype=np.int32))
+                pasted_corners.append(copied_corners)
+
+        # parsed faces start at the loop matching first copied loop, so copied corners give rotation of each face
+        rotation = corner_rotation(mesh.loop_start, mesh.loop_total, np.concatenate(pasted_loops), np.concatenate(pasted_corners)) if pasted_loops else None
+        region = None
+        if self.only_pasted:
+            region = region_from_faces(mesh, np.flatnonzero(face_ids >= 0))
+            vert_ids, edge_ids, face_ids = vert_ids[region.verts], edge_ids[region.edges], face_ids[region.faces]
+            rotation = rotation[region.faces] if rotation is not None else None
+        yield 0.85
+        # bmesh can not reorder loops inside a face - write back to mesh in object mode (bmesh indices are mesh indices)
+        bm = None
+        bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            order_map = yield from scaled_steps(apply_index_maps_steps(active_obj, vert_ids, edge_ids, face_ids, rotation, region), 0.85, 1.0)
+        finally:
+            bpy.ops.object.mode_set(mode='EDIT')
+        context.scene.copy_indices.last_transfer = order_map
+
+        return {'FINISHED'}
+
+
+class VOT_OT_TransferVertIdByTopology(ScopedTransfer, bpy.types.Operator):
+    """Transfer vert ID by topology, islands and seed faces are found automatically"""
+    bl_label = "Transfer IDs using topology"
+    bl_idname = "object.vert_id_transfer_topology"
+    bl_description = "Transfer verts IDs from active to selected objects by topology, no need to select faces on each island\nMesh shape can be different, but topology must be the same. Two mesh objects have to be selected"
+    bl_options = {'REGISTER'}
+
+    @profiled
+    def execute(self, context):
+        sourceObj = context.active_object
+        TargetObjs = [obj for obj in context.selected_objects if obj!=sourceObj and obj.type=='MESH']
+
+        if not TargetObjs:
+            self.report({'ERROR'}, 'You seed to select two mesh objects (source then target that will receive vert order)! Cancelling')
+            return {'CANCELLED'}
+
+        try:
+            scope = self.transfer_scope()
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        report_transfer_results(self, context, transfer_by_topology(sourceObj, TargetObjs, self, scope), sourceObj)
+        return {"FINISHED"}
+
+
+class VOT_OT_TransferVertIdByAnchors(ScopedTransfer, bpy.types.Operator):
+    """Transfer vert ID by topology, seeded from faces matching by position"""
+    bl_label = "Transfer IDs using anchors"
+    bl_idname = "object.vert_id_transfer_hybrid"
+    bl_description = "Transfer verts IDs from active to selected objects by topology, starting from faces that still match by position on each island\nMesh shape can be different (sculpted, deformed), but topology must be the same and some faces have to stay in place. Two mesh objects have to be selected"
+    bl_options = {'REGISTER'}
+
+    delta: bpy.props.FloatProperty(name="Delta", description="Anchor faces have centers closer than half of this distance and corners closer than this distance", default=0.01, min=0, max=1, precision = 4)
+    anchors: bpy.props.IntProperty(name="Anchors", description="Maximum number of anchor faces per island, spread out over island", default=8, min=1, max=256)
+
+    @profiled
+    def execute(self, context):
+        sourceObj = context.active_object
+        TargetObjs = [obj for obj in context.selected_objects if obj!=sourceObj and obj.type=='MESH']
+
+        if not TargetObjs:
+            self.report({'ERROR'}, 'You seed to select two mesh objects (source then target that will receive vert order)! Cancelling')
+            return {'CANCELLED'}
+
+        try:
+            scope = self.transfer_scope()
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        report_transfer_results(self, context, transfer_by_hybrid(sourceObj, TargetObjs, self.delta, self.anchors, self, scope), sourceObj)
+        return {"FINISHED"}
+
+
+class VOT_OT_VerifyVertOrder(bpy.types.Operator):
+    """Compare vert order of selected objects with active object"""
+    bl_label = "Verify vert order"
+    bl_idname = "object.vert_id_verify"
+    bl_description = "Check that selected objects have same vert/edge/face order as active object (same polygon vert sequences, edge vert pairs and vert neighbours), reports match percentages and differing islands\nTwo mesh objects have to be selected"
+    bl_options = {'REGISTER'}
+
+    @profiled
+    def execute(self, context):
+        sourceObj = context.active_object
+        TargetObjs = [obj for obj in context.selected_objects if obj!=sourceObj and obj.type=='MESH']
+
+        if not TargetObjs:
+            self.report({'ERROR'}, 'You seed to select two mesh objects (source then target to verify)! Cancelling')
+            return {'CANCELLED'}
+
+        for target, report in verify_vert_order(sourceObj, TargetObjs):
+            report_verify(self, target, report)
+        return {"FINISHED"}
+
+
+TransferResult = namedtuple("TransferResult", "target matched order_map unmatched_islands seconds peak_bytes")
+TransferResult.__new__.__defaults__ = (None,)
+TransferResult.__doc__ = "Outcome of one target reorder - matched is (verts, edges, faces) count, peak_bytes (of matching) is set by memory limited transfers"
+
+
+class MessageLog():
+    """Stand in for Operator.report when transfer runs without operator (batch mode)"""
+    def __init__(self):
+        self.messages = []
+
+    def report(self, type, message):
+        self.messages.append((type, message))
+
+
+def report_transfer_results(operator, context, results, source=None):
+    """Report results of transfer from source, verify each target when Verify After Transfer preference is on"""
+    addon = context.preferences.addons.get(__package__)
+    verify = source is not None and addon is not None and addon.preferences.auto_verify
+    for result in results:
+        context.scene.copy_indices.last_transfer = result.order_map
+        if result.unmatched_islands:
+            operator.report({'WARNING'}, str(result.unmatched_islands)+' islands of '+result.target.name+' could not be matched')
+        operator.report({'INFO'}, 'Pasted ids of {} verts, {} edges, {} faces'.format(*result.matched))
+        if result.peak_bytes is not None:
+            operator.report({'INFO'}, 'Peak memory '+str(round(result.peak_bytes / 2 ** 20))+' MB')
+    if verify:
+        for target, report in verify_vert_order(source, [result.target for result in results]):
+            report_verify(operator, target, report)
+
+
+def verify_vert_order(source, targets):
+    """[(target, core.VerifyReport)] comparing element order of each target mesh object with source"""
+    with profiler.stage("read source", len(source.data.vertices), source.name):
+        src = read_mesh_arrays(source.data)
+    reports = []
+    for target in targets:
+        with profiler.stage("verify", len(target.data.polygons), target.name):
+            reports.append((target, verify_topology(src, read_mesh_arrays(target.data))))
+    return reports
+
+
+def report_verify(operator, target, report):
+    lines = verify_summary_lines(report)
+    operator.report({'INFO'} if len(lines) == 1 else {'WARNING'}, target.name+': '+lines[0])
+    for line in lines[1:]:
+        operator.report({'INFO'}, target.name+': '+line)
+
+
+def _transfer_result(target, vert_map, edge_map, face_map, rotation, start_time, unmatched_islands=0, region=None):
+    return run_steps(_transfer_result_steps(target, vert_map, edge_map, face_map, rotation, start_time, unmatched_islands, region))
+
+
+def _transfer_result_steps(target, vert_map, edge_map, face_map, rotation, start_time, unmatched_islands=0, region=None):
+    order_map = yield from apply_index_maps_steps(target, vert_map, edge_map, face_map, rotation, region)
+    matched = tuple(int(np.count_nonzero(id_map >= 0)) for id_map in (vert_map, edge_map, face_map))
+    return TransferResult(target, matched, order_map, unmatched_islands, time.perf_counter() - start_time)
+
+
+def _transfer_steps(targets, read_arrays, match_steps, threads=0, chunk_size=0, scope=None, reporter=None):
+    """Step generator reordering targets - yields progress 0..1, returns [TransferResult].
+    match_steps(*read_arrays(target)) is step generator returning (vert_map, edge_map, face_map, rotation).
+    chunk_size = 0: targets are matched in parallel (see _match_targets), progress after each target.
+    chunk_size > 0 (modal operators): one target at a time, with steps between query chunks, repair and write back.
+    scope(target, mesh) - Region of target MeshArrays to match and reorder (None = whole mesh), rest of mesh keeps its order.
+    Targets with nothing in scope are skipped with a warning to reporter (operator or MessageLog).
+    Closing generator before end (cancel) restores already reordered targets"""
+    if scope is not None:
+        read_arrays, match_steps = _scoped_steps(read_arrays, match_steps, scope)
+    results = []
+    try:
+        if chunk_size:
+            for n, target in enumerate(targets):
+                start_time = time.perf_counter()
+                with profiler.stage("read target", len(target.data.vertices), target.name):
+                    arrays = read_arrays(target)
+                yield (n + 0.1) / len(targets)
+                if scope is not None and _skip_empty_region(target, arrays[1], reporter):
+                    continue
+                maps = yield from scaled_steps(match_steps(*arrays), (n + 0.1) / len(targets), (n + 0.7) / len(targets))
+                region = maps[4] if scope is not None else None
+                result = yield from scaled_steps(_transfer_result_steps(target, *maps[:4], start_time, region=region), (n + 0.7) / len(targets), (n + 1) / len(targets))
+                results.append(result)
+        else:
+            def match_arrays(*arrays):
+                return run_steps(match_steps(*arrays))
+            for n, (target, maps, start_time) in enumerate(_match_targets(targets, read_arrays, match_arrays, threads)):
+                if scope is None or not _skip_empty_region(target, maps[4], reporter):
+                    results.append(_transfer_result(target, *maps[:4], start_time, region=maps[4] if scope is not None else None))
+                yield (n + 1) / len(targets)
+    except GeneratorExit:
+        for result in reversed(results):
+            result.order_map.revert(result.target)
+        raise
+    return results
+
+
+def _scoped_steps(read_arrays, match_steps, scope):
+    """read_arrays/match_steps of _transfer_steps that match only region of each target picked by scope,
+    scoped match_steps returns region as fifth item"""
+    def scoped_read(target):
+        mesh, *arrays = read_arrays(target)
+        return (*_scoped_mesh(target, mesh, scope), *arrays)
+
+    def scoped_match(mesh, region, *arrays):
+        maps = yield from match_steps(mesh, *arrays)
+        return (*maps, region)
+    return scoped_read, scoped_match
+
+
+def _scoped_mesh(target, mesh, scope):
+    """(MeshArrays to match, Region) - region part of mesh if scope picks one, else (mesh, None)"""
+    region = scope(target, mesh) if scope is not None else None
+    if region is None:
+        return mesh, None
+    return region_mesh(mesh, region), region
+
+
+def _skip_empty_region(target, region, reporter=None):
+    """True when scope picked nothing on target (reported as warning)"""
+    if region is None or len(region.faces):
+        return False
+    if reporter is not None:
+        reporter.report({'WARNING'}, target.name+': nothing in scope, skipped')
+    return True
+
+
+def selected_faces_scope(target, mesh):
+    """Transfer scope (see _transfer_steps) - faces selected on target mesh"""
+    return region_from_faces(mesh, np.flatnonzero(_read_layer(target.data.polygons, "select", 1, bool).ravel()))
+
+
+def islands_scope(numbers):
+    """Transfer scope - face islands of target with given numbers (numbered in order of their lowest face, as listed
+    by verify reports)"""
+    numbers = np.asarray(numbers, dtype=np.int64)
+
+    def scope(target, mesh):
+        return region_from_faces(mesh, np.flatnonzero(np.isin(island_numbers(mesh), numbers)))
+    return scope
+
+
+def parse_island_numbers(text):
+    """'0, 3-5' -> [0, 3, 4, 5]. Raises ValueError"""
+    numbers = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        if not first.isdigit() or not (last.isdigit() or not last):
+            raise ValueError("Invalid island numbers: "+text)
+        numbers.extend(range(int(first), int(last or first) + 1))
+    if not numbers:
+        raise ValueError("No island numbers given")
+    return numbers
+
+
+def transfer_scope(scope, islands=""):
+    """Scope function for scope name ('ALL', 'SELECTED' or 'ISLANDS' with island numbers text), None for whole mesh"""
+    if scope == 'SELECTED':
+        return selected_faces_scope
+    if scope == 'ISLANDS':
+        return islands_scope(parse_island_numbers(islands))
+    return None
+
+
+def _match_targets(targets, read_arrays, match_arrays, threads=0):
+    """Yield (target, match_arrays result, start time) in target order.
+    Target arrays are read on main thread, matched on thread pool (source index is shared read only),
+    so only reading and the final write back (done by caller between yields) touch blender data"""
+    threads = threads or os.cpu_count() or 1
+
+    def read_target(target):
+        with profiler.stage("read target", len(target.data.vertices), target.name):
+            return read_arrays(target)
+
+    def match_target(name, arrays):
+        with profiler.stage("match", None, name):
+            return match_arrays(*arrays)
+
+    if threads == 1 or len(targets) < 2:
+        for target in targets:
+            start_time = time.perf_counter()
+            yield target, match_target(target.name, read_target(target)), start_time
+        return
+    with ThreadPoolExecutor(threads) as pool:
+        pending = deque()
+        for target in targets:
+            start_time = time.perf_counter()
+            pending.append((target, pool.submit(match_target, target.name, read_target(target)), start_time))
+            if len(pending) > threads:  # keep memory bounded - write back finished targets while others run
+                target, future, start_time = pending.popleft()
+                yield target, future.result(), start_time
+        while pending:
+            target, future, start_time = pending.popleft()
+            yield target, future.result(), start_time
+
+
+def transfer_by_proximity(source, targets, delta=0.1, derive_from_verts=False, threads=0, candidates=0, sequence=False, max_memory=0, scope=None, reporter=None):
+    """Reorder target mesh objects by vert/edge/face positions of source. Returns [TransferResult]
+    candidates > 0 makes the match one to one, considering that many nearest source elements per target element.
+    sequence - targets are frames of one mesh sequence (same element order, sorted by name), each frame starts from
+    match of previous frame and only elements that moved further than delta are searched.
+    max_memory > 0 (MB) streams targets one at a time through query chunks sized to stay around that limit,
+    results then have peak_bytes set. scope - match and reorder only part of each target (see _transfer_steps),
+    scoped targets are not streamed. reporter gets warnings (operator or MessageLog)"""
+    return run_steps(proximity_steps(source, targets, delta, derive_from_verts, threads, candidates, sequence, max_memory, scope, reporter))
+
+
+def proximity_steps(source, targets, delta=0.1, derive_from_verts=False, threads=0, candidates=0, sequence=False, max_memory=0, scope=None, reporter=None, chunk_size=0):
+    """Step generator version of transfer_by_proximity (see _transfer_steps)"""
+    max_memory = 0 if scope is not None else max_memory
+    with profiler.stage("read source", len(source.data.vertices), source.name):
+        src = read_mesh_arrays(source.data)
+    with profiler.stage("build index", len(src.co), source.name):
+        indices = proximity_indices(src, derive_from_verts, source_cache(source))
+    yield 0.0
+    if sequence or max_memory:  # sequence frames depend on each other, streamed targets are matched one at a time
+        targets = sorted(targets, key=lambda target: natural_sort_key(target.name)) if sequence else targets
+        threads = 1
+    query_workers = -1 if chunk_size or threads == 1 or len(targets) < 2 else 1  # parallel over targets, not inside query
+    previous = [None]  # sequence: maps of previous frame
+    peaks = []  # max_memory: peak bytes of matching each target
+
+    def read_arrays(target):
+        return (MeshReader(target.data) if max_memory else read_mesh_arrays(target.data),)
+
+    def match_steps(mesh):
+        if max_memory:
+            source_bytes = _source_nbytes(src, indices)
+            stream_chunk = _stream_chunk_size(mesh, max_memory, source_bytes, stream_resident_bytes(*mesh.counts, candidates=candidates), reporter)
+            with MemoryMeter(source_bytes) as meter:
+                maps = yield from proximity_stream_steps(src, indices, mesh, delta, stream_chunk, query_workers, candidates, previous[0])
+            peaks.append(meter.peak)
+        else:
+            maps = yield from proximity_match_steps(src, indices, mesh, delta, query_workers, chunk_size, candidates, previous[0])
+        if sequence:
+            previous[0] = maps[:3]
+        return maps
+
+    results = yield from _transfer_steps(targets, read_arrays, match_steps, threads, chunk_size, scope, reporter)
+    if max_memory:
+        results = [result._replace(peak_bytes=peak) for result, peak in zip(results, peaks)]
+    return results
+
+
+def _source_nbytes(src, indices):
+    """Memory held for source during whole transfer - its MeshArrays and search indices"""
+    return sum(array.nbytes for array in src if array is not None) + indices_nbytes(indices)
+
+
+def _stream_chunk_size(reader, max_memory, source_bytes, target_bytes, reporter=None):
+    """Query chunk size for max_memory MB, warns reporter when the limit can not be met even with smallest chunks
+    or by writing the new order back. source_bytes is held all the time, target_bytes while matching"""
+    write_back_bytes = source_bytes + reorder_nbytes(*reader.counts, largest_layer_nbytes(reader.mesh))
+    needed = stream_min_bytes(source_bytes + target_bytes, write_back_bytes=write_back_bytes)
+    if needed > max_memory << 20 and reporter is not None:
+        reporter.report({'WARNING'}, reader.mesh.name+': memory limit of '+str(max_memory)+' MB can not be met, needs at least '+str(-(-needed >> 20))+' MB')
+    return stream_chunk_size(max_memory << 20, source_bytes + target_bytes)
+
+
+def natural_sort_key(name):
+    """Sort key putting numbered names in number order (frame_2 before frame_10)"""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.split(r"(\d+)", name)]
+
+
+def transfer_by_uv(source, targets, delta=0.01, threads=0, uv_precision=0.00001, max_memory=0, scope=None, reporter=None):
+    """Reorder target mesh objects by face UVs of source. Returns [TransferResult]
+    Faces with same quantized UV corner sequence are matched exactly (and corner rotation is aligned),
+    remaining faces by nearest UV center within delta. max_memory, scope, reporter - see transfer_by_proximity"""
+    return run_steps(uv_steps(source, targets, delta, threads, uv_precision, max_memory, scope, reporter))
+
+
+def uv_steps(source, targets, delta=0.01, threads=0, uv_precision=0.00001, max_memory=0, scope=None, reporter=None, chunk_size=0):
+    """Step generator version of transfer_by_uv (see _transfer_steps)"""
+    max_memory = 0 if scope is not None else max_memory
+    with profiler.stage("read source", len(source.data.loops), source.name):
+        src = read_mesh_arrays(source.data, uvs=True)
+    with profiler.stage("build index", len(src.loop_total), source.name):
+        indices = uv_indices(src, uv_precision, source_cache(source))
+    yield 0.0
+    if max_memory:
+        threads = 1
+    query_workers = -1 if chunk_size or threads == 1 or len(targets) < 2 else 1
+    peaks = []  # max_memory: peak bytes of matching each target
+
+    def read_arrays(target):
+        return (MeshReader(target.data) if max_memory else read_mesh_arrays(target.data, uvs=True),)
+
+    def match_steps(mesh):
+        if max_memory:
+            source_bytes = _source_nbytes(src, indices)
+            stream_chunk = _stream_chunk_size(mesh, max_memory, source_bytes, stream_resident_bytes(*mesh.counts, uvs=True), reporter)
+            with MemoryMeter(source_bytes) as meter:
+                maps = yield from uv_stream_steps(src, indices, mesh, mesh.counts[:2], delta, stream_chunk, uv_precision, query_workers)
+            peaks.append(meter.peak)
+            return maps
+        maps = yield from uv_match_steps(src, indices, mesh, delta, uv_precision, query_workers, chunk_size)
+        return maps
+
+    results = yield from _transfer_steps(targets, read_arrays, match_steps, threads, chunk_size, scope, reporter)
+    if max_memory:
+        results = [result._replace(peak_bytes=peak) for result, peak in zip(results, peaks)]
+    return results
+
+
+def transfer_by_topology(source, targets, reporter=None, scope=None):
+    """Reorder target mesh objects by topology of source - islands and seed faces are found automatically.
+    reporter gets report() calls from flood fill (operator or MessageLog). Returns [TransferResult]
+    scope - see _transfer_steps, only whole islands in scope can match source islands"""
+    reporter = reporter or MessageLog()
+    with profiler.stage("islands", len(source.data.polygons), source.name):
+        src = read_mesh_arrays(source.data)
+        src_islands, src_graph = MeshIslands(src), LoopGraph(src)
+
+    results = []
+    for target in targets:
+        start_time = time.perf_counter()
+        with profiler.stage("islands", len(target.data.polygons), target.name):
+            mesh, region = _scoped_mesh(target, read_mesh_arrays(target.data), scope)
+            if _skip_empty_region(target, region, reporter):
+                continue
+            islands, graph = MeshIslands(mesh), LoopGraph(mesh)
+        with profiler.stage("flood fill", len(mesh.loop_total), target.name):
+            vert_map, edge_map, face_map, rotation, unmatched = topology_match(src, src_islands, src_graph, mesh, islands, graph, reporter)
+        results.append(_transfer_result(target, vert_map, edge_map, face_map, rotation, start_time, unmatched, region))
+    return results
+
+
+def transfer_by_hybrid(source, targets, delta=0.1, anchors=8, reporter=None, scope=None):
+    """Reorder target mesh objects by topology of source, propagated from up to anchors faces per island that match
+    source by position within delta (see core.pick_anchors). Works on deformed shapes without seed selection.
+    reporter gets report() calls about disagreeing anchors (operator or MessageLog). Returns [TransferResult]
+    scope - see _transfer_steps"""
+    reporter = reporter or MessageLog()
+    with profiler.stage("islands", len(source.data.polygons), source.name):
+        src = read_mesh_arrays(source.data)
+        src_islands, src_graph = MeshIslands(src), LoopGraph(src)
+    with profiler.stage("build index", len(src.loop_total), source.name):
+        src_face_index = face_center_index(src, source_cache(source))
+
+    results = []
+    for target in targets:
+        start_time = time.perf_counter()
+        with profiler.stage("islands", len(target.data.polygons), target.name):
+            mesh, region = _scoped_mesh(target, read_mesh_arrays(target.data), scope)
+            if _skip_empty_region(target, region, reporter):
+                continue
+            islands, graph = MeshIslands(mesh), LoopGraph(mesh)
+        with profiler.stage("anchored fill", len(mesh.loop_total), target.name):
+            vert_map, edge_map, face_map, rotation, unmatched = hybrid_match(src, src_islands, src_graph, src_face_index, mesh, islands, graph, delta, anchors, reporter)
+        results.append(_transfer_result(target, vert_map, edge_map, face_map, rotation, start_time, unmatched, region))
+    return results
+
+
+TRANSFER_MODES = {
+    'PROXIMITY': transfer_by_proximity,
+    'UV': transfer_by_uv,
+    'TOPOLOGY': transfer_by_topology,
+    'HYBRID': transfer_by_hybrid,
+}
+
+
+def selected_face_pairs(operator, bm):
+    """Seed face pairs [(sel_faces, active_face)] from faces in selection history, taken two by two (second face
+    of pair is its active face). Two selected faces without history make one pair. Returns None if faces can not be paired"""
+    history = [e for e in bm.select_history if isinstance(e, bmesh.types.BMFace) and e.select]
+    if len(history) < 2:
+        sel_faces = [face for face in bm.faces if face.select]
+        if len(sel_faces) != 2:
+            operator.report({'WARNING'}, "Two faces must be selected")
+            return None
+        if not bm.faces.active or bm.faces.active not in sel_faces:
+            operator.report({'WARNING'}, "Two faces must be active")
+            return None
+        history = [face for face in sel_faces if face is not bm.faces.active] + [bm.faces.active]
+    if len(history) % 2 != 0:
+        operator.report({'WARNING'}, "Faces must be selected in pairs (two faces per island)")
+        return None
+    return [(history[i:i + 2], history[i + 1]) for i in range(0, len(history), 2)]
+
+
+def bmesh_mesh_arrays(bm):
+    """MeshArrays of bmesh (indices have to be up to date), loops in face order like in mesh"""
+    co = np.array([v.co[:] for v in bm.verts], dtype=np.float32).reshape(-1, 3)
+    edge_verts = np.array([(e.verts[0].index, e.verts[1].index) for e in bm.edges], dtype=np.int32).reshape(-1, 2)
+    loop_total = np.fromiter((len(f.loops) for f in bm.faces), dtype=np.int32, count=len(bm.faces))
+    loop_start = (np.cumsum(loop_total) - loop_total).astype(np.int32)
+    loop_verts = np.array([loop.vert.index for f in bm.faces for loop in f.loops], dtype=np.int32)
+    loop_edges = np.array([loop.edge.index for f in bm.faces for loop in f.loops], dtype=np.int32)
+    face_hidden = np.fromiter((f.hide for f in bm.faces), dtype=bool, count=len(bm.faces))
+    return MeshArrays(co, edge_verts, loop_start, loop_total, loop_verts, loop_edges, face_hidden)
+
+
+def flood_fill_selected(operator, bm, mesh, graph, sel_faces, active_face, flip_normal=False):
+    """core flood_fill from two selected bmesh faces. Problems are reported to operator and
+    faces causing them get selected. Returns ParsedFaces or None"""
+    second_face = sel_faces[1] if sel_faces[0] is active_face else sel_faces[0]
+    try:
+        return flood_fill(mesh, graph, active_face.index, second_face.index, flip_normal)
+    except FloodFillError as e:
+        if e.faces:
+            bpy.ops.mesh.select_all(action='DESELECT')
+            for face in e.faces:
+                bm.faces[face].select = True
+        operator.report({'WARNING'}, str(e))
+        return None
+
+
+source_index_cache = SourceIndexCache()
+
+
+def source_cache(source):
+    """cache argument of core index builders - keeps indices of source object in source_index_cache"""
+    def cache(kind, build, *arrays):
+        return source_index_cache.get((source.name_full, kind), content_fingerprint(*arrays), build)
+    return cache
+
+
+@bpy.app.handlers.persistent
+def invalidate_source_index_cache(scene, depsgraph):
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            source_index_cache.invalidate(update.id.original.name_full)
+
+
+def read_vert_positions(mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def read_edge_verts(mesh):
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    return edge_verts.reshape(-1, 2)
+
+
+def read_poly_loops(mesh):
+    """(loop_start, loop_total, loop vertex indices) arrays of mesh polygons"""
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    return loop_start, loop_total, loop_verts
+
+
+def read_loop_edges(mesh):
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    return loop_edges
+
+
+def read_loop_uvs(mesh):
+    """(n, 2) loop uvs of active UV map"""
+    if not mesh.uv_layers.active:
+        raise ValueError(mesh.name+" has no UV map")
+    loop_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", loop_uvs)
+    return loop_uvs.reshape(-1, 2)
+
+
+def read_mesh_arrays(mesh, uvs=False):
+    """MeshArrays of mesh, with loop uvs of active UV map if uvs is True"""
+    loop_uvs = read_loop_uvs(mesh) if uvs else None
+    loop_start, loop_total, loop_verts = read_poly_loops(mesh)
+    face_hidden = _read_layer(mesh.polygons, "hide", 1, bool).ravel()
+    return MeshArrays(read_vert_positions(mesh), read_edge_verts(mesh), loop_start, loop_total, loop_verts,
+                      read_loop_edges(mesh), face_hidden, loop_uvs)
+
+
+class MeshReader():
+    """Reads one mesh array at a time by MeshArrays field name, for streamed matching (core.proximity_stream_steps).
+    foreach_get can only fill whole collections, so every array is read whole, but only when a stage needs it"""
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    @property
+    def counts(self):
+        mesh = self.mesh
+        return len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops)
+
+    def __call__(self, name):
+        mesh = self.mesh
+        if name == 'co':
+            return read_vert_positions(mesh)
+        if name == 'edge_verts':
+            return read_edge_verts(mesh)
+        if name in ('loop_start', 'loop_total'):
+            return _read_layer(mesh.polygons, name, 1, np.int32).ravel()
+        if name == 'loop_verts':
+            return _read_layer(mesh.loops, "vertex_index", 1, np.int32).ravel()
+        if name == 'loop_edges':
+            return read_loop_edges(mesh)
+        if name == 'uvs':
+            return read_loop_uvs(mesh)
+        raise KeyError(name)
+
+
+# attribute data_type -> (foreach_get property, values per element, buffer dtype)
+ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+# topology is written through vertices/edges/polygons/loops api, its values have to be remapped not just moved
+TOPOLOGY_ATTRIBUTES = {".edge_verts", ".corner_vert", ".corner_edge"}
+# builtin element properties, for blender versions that do not store them as generic attributes yet
+BUILTIN_LAYERS = {
+    'POINT': (("co", 3, np.float32), ("select", 1, bool), ("hide", 1, bool)),
+    'EDGE': (("select", 1, bool), ("hide", 1, bool), ("use_seam", 1, bool), ("use_edge_sharp", 1, bool)),
+    'FACE': (("material_index", 1, np.int32), ("use_smooth", 1, bool), ("select", 1, bool), ("hide", 1, bool)),
+}
+
+
+def _read_layer(collection, prop, size, dtype):
+    data = np.empty(len(collection) * size, dtype=dtype)
+    try:
+        collection.foreach_get(prop, data)
+    except (AttributeError, TypeError, RuntimeError):  # property not available in this blender version
+        return None
+    return data.reshape(len(collection), size)
+
+
+def _mesh_layers(mesh):
+    """Per element layers of mesh besides topology: (collection getter, property, values per element, dtype, domain).
+    Getters look the layer up again, so they stay valid while other layers are written"""
+    collections = {'POINT': mesh.vertices, 'EDGE': mesh.edges, 'FACE': mesh.polygons, 'CORNER': mesh.loops}
+    for domain, builtin in BUILTIN_LAYERS.items():
+        for prop, size, dtype in builtin:
+            yield (lambda domain=domain: collections[domain]), prop, size, dtype, domain
+    for attr in getattr(mesh, "attributes", ()):
+        layout = ATTRIBUTE_LAYOUTS.get(attr.data_type)
+        if attr.name in TOPOLOGY_ATTRIBUTES or layout is None or attr.domain not in collections:
+            continue
+        prop, size, dtype = layout
+        yield (lambda name=attr.name: mesh.attributes[name].data), prop, size, dtype, attr.domain
+    for layer_list, prop, size in ((mesh.uv_layers, "uv", 2), (getattr(mesh, "vertex_colors", ()), "color", 4)):
+        for layer in layer_list:
+            yield (lambda layer_list=layer_list, name=layer.name: layer_list[name].data), prop, size, np.float32, 'CORNER'
+
+
+def largest_layer_nbytes(mesh):
+    """Bytes of the biggest layer reorder_mesh holds at once (see core.reorder_nbytes)"""
+    counts = {'POINT': len(mesh.vertices), 'EDGE': len(mesh.edges), 'FACE': len(mesh.polygons), 'CORNER': len(mesh.loops)}
+    sizes = [counts[domain] * size * np.dtype(dtype).itemsize for _, _, size, dtype, domain in _mesh_layers(mesh)]
+    sizes.append(counts['CORNER'] * 12 if getattr(mesh, "has_custom_normals", False) else 0)
+    return max(sizes)
+
+
+def reorder_mesh(mesh, vert_ids, edge_ids, face_ids, obj=None, loop_ids=None):
+    """Give element i of mesh index vert_ids[i] (edge_ids[i], face_ids[i]) in place, without bmesh round trip.
+    loop_ids (new index of every loop, e.g. from loop_ids_from_faces with rotation) can also rotate corners
+    inside polygons, by default loops just follow their polygons.
+    Layers are moved one at a time (read, permute, foreach_set) to keep memory down. Layers that are exposed twice
+    (builtin property and generic attribute) are moved once - every layer is fingerprinted before writing, one that
+    reads differently later was already moved through the other. Vertex groups need obj. Returns new loop indices"""
+    new_to_old = {
+        'POINT': invert_permutation(np.asarray(vert_ids, dtype=np.int64)),
+        'EDGE': invert_permutation(np.asarray(edge_ids, dtype=np.int64)),
+        'FACE': invert_permutation(np.asarray(face_ids, dtype=np.int64)),
+    }
+
+    # topology
+    edge_verts = read_edge_verts(mesh)
+    loop_start = _read_layer(mesh.polygons, "loop_start", 1, np.int32).ravel()
+    loop_total = _read_layer(mesh.polygons, "loop_total", 1, np.int32).ravel()
+    loop_verts = _read_layer(mesh.loops, "vertex_index", 1, np.int32).ravel()
+    loop_edges = _read_layer(mesh.loops, "edge_index", 1, np.int32).ravel()
+    new_to_old['CORNER'], new_loop_start = corner_order(loop_start, loop_total, new_to_old['FACE'])
+    if loop_ids is not None:
+        new_to_old['CORNER'] = invert_permutation(np.asarray(loop_ids, dtype=np.int64))
+        if not np.array_equal(loop_faces(loop_start, loop_total)[0][new_to_old['CORNER']], np.repeat(new_to_old['FACE'], loop_total[new_to_old['FACE']])):
+            raise ValueError("loop order does not keep loops inside their polygons")
+
+    # every other per element layer: (collection getter, property, size, dtype, domain, content fingerprint)
+    layers = []
+    for get_collection, prop, size, dtype, domain in _mesh_layers(mesh):
+        data = _read_layer(get_collection(), prop, size, dtype)
+        if data is not None:
+            layers.append((get_collection, prop, size, dtype, domain, content_fingerprint(data)))
+    data = None
+
+    custom_normals = None
+    if getattr(mesh, "has_custom_normals", False):
+        if hasattr(mesh, "corner_normals"):  # blender 4.1+
+            custom_normals = _read_layer(mesh.corner_normals, "vector", 3, np.float32)
+        else:
+            mesh.calc_normals_split()
+            custom_normals = _read_layer(mesh.loops, "normal", 3, np.float32)
+
+    vertex_weights = []  # (group index, old vertex index, weight) of moved verts - no bulk api for deform verts
+    if obj is not None and obj.vertex_groups:
+        vertices = mesh.vertices
+        vertex_weights = [(g.group, v, g.weight) for v in np.flatnonzero(vert_ids != np.arange(len(vert_ids))).tolist() for g in vertices[v].groups]
+
+    # write topology
+    mesh.polygons.foreach_set("loop_start", new_loop_start.astype(np.int32))
+    if not bpy.types.MeshPolygon.bl_rna.properties["loop_total"].is_readonly:  # derived from loop_start in blender 4.0+
+        mesh.polygons.foreach_set("loop_total", loop_total[new_to_old['FACE']])
+    mesh.loops.foreach_set("vertex_index", vert_ids[loop_verts[new_to_old['CORNER']]].astype(np.int32))
+    mesh.loops.foreach_set("edge_index", edge_ids[loop_edges[new_to_old['CORNER']]].astype(np.int32))
+    mesh.edges.foreach_set("vertices", vert_ids[edge_verts[new_to_old['EDGE']]].astype(np.int32).ravel())
+
+    for get_collection, prop, size, dtype, domain, fingerprint in layers:
+        data = _read_layer(get_collection(), prop, size, dtype)
+        if content_fingerprint(data) == fingerprint:
+            get_collection().foreach_set(prop, data[new_to_old[domain]].ravel())
+    data = None
+    if mesh.shape_keys:
+        for key_block in mesh.shape_keys.key_blocks:
+            data = _read_layer(key_block.data, "co", 3, np.float32)
+            key_block.data.foreach_set("co", data[new_to_old['POINT']].ravel())
+        data = None
+
+    if vertex_weights:
+        groups, old_verts, weights = (np.array(values) for values in zip(*vertex_weights))
+        new_verts = vert_ids[old_verts]
+        for group_index in np.unique(groups).tolist():
+            vertex_group = obj.vertex_groups[group_index]
+            in_group = groups == group_index
+            vertex_group.remove(old_verts[in_group].tolist())
+            # one add() call per distinct weight value
+            group_weights = weights[in_group]
+            group_verts = new_verts[in_group]
+            for weight in np.unique(group_weights).tolist():
+                vertex_group.add(group_verts[group_weights == weight].tolist(), weight, 'REPLACE')
+
+    mesh.update()
+    if custom_normals is not None:
+        mesh.normals_split_custom_set(custom_normals[new_to_old['CORNER']])
+    return invert_permutation(new_to_old['CORNER'])
+
+
+def mesh_topology_fingerprint(mesh):
+    _, loop_total, loop_verts = read_poly_loops(mesh)
+    return topology_fingerprint(read_edge_verts(mesh), loop_total, loop_verts)
+
+
+class VertexOrderMap():
+    """New index of every vert/edge/face/loop of a mesh, with fingerprint of topology it was computed for.
+    Saved as versioned binary file (64 byte header + int32 arrays) which is memory mapped back on load,
+    so one map can be applied to many meshes without computing the match again"""
+
+    FILE_EXT = ".votmap"
+    MAGIC = b"VOTMAP\0\0"
+    VERSION = 1
+    HEADER = struct.Struct("<8sI4Q16s4x")  # magic, version, vert/edge/face/loop counts, fingerprint
+
+    def __init__(self, vert_ids, edge_ids, face_ids, loop_ids, fingerprint):
+        self.vert_ids = vert_ids
+        self.edge_ids = edge_ids
+        self.face_ids = face_ids
+        self.loop_ids = loop_ids
+        self.fingerprint = fingerprint
+
+    @property
+    def counts(self):
+        return len(self.vert_ids), len(self.edge_ids), len(self.face_ids), len(self.loop_ids)
+
+    def save(self, filepath):
+        with open(filepath, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, *self.counts, self.fingerprint))
+            for ids in (self.vert_ids, self.edge_ids, self.face_ids, self.loop_ids):
+                f.write(np.ascontiguousarray(ids, dtype=np.int32).tobytes())
+
+    @classmethod
+    def load(cls, filepath):
+        with open(filepath, 'rb') as f:
+            header = f.read(cls.HEADER.size)
+        if len(header) != cls.HEADER.size:
+            raise ValueError("Not a vert order map file: "+filepath)
+        magic, version, vert_count, edge_count, face_count, loop_count, fingerprint = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a vert order map file: "+filepath)
+        if version > cls.VERSION:
+            raise ValueError("Vert order map file version "+str(version)+" is newer than this addon supports")
+        counts = (vert_count, edge_count, face_count, loop_count)
+        data = np.memmap(filepath, dtype=np.int32, mode='r', offset=cls.HEADER.size, shape=(sum(counts),))
+        ends = np.cumsum(counts)
+        return cls(*(data[end - count:end] for count, end in zip(counts, ends)), fingerprint)
+
+    def check(self, mesh, check_fingerprint=True):
+        """Raise ValueError if map can not be applied to mesh"""
+        if self.counts != (len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops)):
+            raise ValueError("vert/edge/face/loop count does not match vert order map")
+        if check_fingerprint and mesh_topology_fingerprint(mesh) != self.fingerprint:
+            raise ValueError("topology does not match vert order map")
+
+    def apply(self, obj, check_fingerprint=True):
+        self.check(obj.data, check_fingerprint)
+        reorder_mesh(obj.data, np.asarray(self.vert_ids), np.asarray(self.edge_ids), np.asarray(self.face_ids), obj, np.asarray(self.loop_ids))
+
+    def revert(self, obj):
+        """Put elements of obj reordered by this map back to their original order"""
+        vert_ids, edge_ids, face_ids, loop_ids = (invert_permutation(np.asarray(ids, dtype=np.int64)) for ids in (self.vert_ids, self.edge_ids, self.face_ids, self.loop_ids))
+        reorder_mesh(obj.data, vert_ids, edge_ids, face_ids, obj, loop_ids)
+
+
+def apply_index_maps(obj, vert_map, edge_map, face_map, rotation=None, region=None):
+    """Reorder obj mesh by matched ids (-1 = not matched) and polygon corner rotation. Returns applied VertexOrderMap.
+    With region (core.Region) maps and rotation are of region elements only (see core.region_mesh), they are only
+    moved between indices of region and rest of mesh keeps its order (see core.scoped_index_map)"""
+    return run_steps(apply_index_maps_steps(obj, vert_map, edge_map, face_map, rotation, region))
+
+
+def apply_index_maps_steps(obj, vert_map, edge_map, face_map, rotation=None, region=None):
+    """Step generator version of apply_index_maps, write back is a separate step"""
+    mesh = obj.data
+    with profiler.stage("fingerprint", len(mesh.loops), obj.name):
+        fingerprint = mesh_topology_fingerprint(mesh)
+    with profiler.stage("repair ids", len(vert_map) + len(edge_map) + len(face_map), obj.name):
+        if region is None:
+            vert_ids, edge_ids, face_ids = complete_index_map(vert_map), complete_index_map(edge_map), complete_index_map(face_map)
+        else:
+            vert_ids = scoped_index_map(vert_map, region.verts, len(mesh.vertices))
+            edge_ids = scoped_index_map(edge_map, region.edges, len(mesh.edges))
+            face_ids = scoped_index_map(face_map, region.faces, len(mesh.polygons))
+            if rotation is not None:
+                region_rotation, rotation = rotation, np.zeros(len(mesh.polygons), dtype=np.int64)
+                rotation[region.faces] = region_rotation
+        loop_start, loop_total, _ = read_poly_loops(mesh)
+        loop_ids = loop_ids_from_faces(face_ids, loop_total, rotation, loop_start)
+    yield 0.5
+    with profiler.stage("write back", len(mesh.vertices), obj.name):
+        reorder_mesh(mesh, vert_ids, edge_ids, face_ids, obj, loop_ids)
+    return VertexOrderMap(vert_ids, edge_ids, face_ids, loop_ids, fingerprint)
+
+
+class VOT_OT_SaveVertOrderMap(bpy.types.Operator, ExportHelper):
+    """Save vert order computed by last transfer to file"""
+    bl_idname = "object.vert_id_map_save"
+    bl_label = "Save Vert Order Map"
+    bl_description = "Save vert/edge/face/loop order computed by last transfer, so it can be applied to other meshes with same topology"
+    bl_options = {'REGISTER'}
+
+    filename_ext = VertexOrderMap.FILE_EXT
+    filter_glob: bpy.props.StringProperty(default="*" + VertexOrderMap.FILE_EXT, options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.copy_indices.last_transfer is not None
+
+    @profiled
+    def execute(self, context):
+        context.scene.copy_indices.last_transfer.save(self.filepath)
+        self.report({'INFO'}, 'Saved vert order map to '+self.filepath)
+        return {'FINISHED'}
+
+
+class VOT_OT_ApplyVertOrderMap(bpy.types.Operator, ImportHelper):
+    """Apply saved vert order to selected meshes"""
+    bl_idname = "object.vert_id_map_apply"
+    bl_label = "Apply Vert Order Map"
+    bl_description = "Reorder selected meshes with saved vert order map (no matching is computed)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = VertexOrderMap.FILE_EXT
+    filter_glob: bpy.props.StringProperty(default="*" + VertexOrderMap.FILE_EXT, options={'HIDDEN'})
+    check_fingerprint: BoolProperty(name="Check Topology", description="Only apply to meshes with same topology as the mesh map was computed for (otherwise only element counts have to match)", default=True)
+
+    @profiled
+    def execute(self, context):
+        order_map = VertexOrderMap.load(self.filepath)
+        applied = 0
+        for obj in context.selected_objects:
+            if obj.type != 'MESH':
+                continue
+            try:
+                order_map.apply(obj, self.check_fingerprint)
+                applied += 1
+            except ValueError as e:
+                self.report({'WARNING'}, obj.name+': '+str(e))
+        self.report({'INFO'}, 'Applied vert order map to '+str(applied)+' meshes')
+        return {'FINISHED'}
+
+
+def batch_parse_args(argv):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python transfer_vertex_order/__main__.py --",
+        description="Reorder mesh objects in .blend files to match vert order of source mesh (no UI needed)")
+    parser.add_argument("targets", nargs="+", help=".blend files or glob patterns")
+    parser.add_argument("--source-object", required=True, help="Name of source mesh object")
+    parser.add_argument("--source-file", help=".blend file with source object (default: source object is in each target file)")
+    parser.add_argument("--objects", nargs="+", default=["*"], help="Target object name patterns (default: all meshes but source)")
+    parser.add_argument("--mode", choices=[mode.lower() for mode in TRANSFER_MODES], default="proximity")
+    parser.add_argument("--delta", type=float, help="Search distance for proximity/uv/hybrid mode")
+    parser.add_argument("--derive-from-verts", action="store_true", help="Proximity mode: derive edge/face order from vert match")
+    parser.add_argument("--anchors", type=int, help="Hybrid mode: maximum anchor faces per island")
+    parser.add_argument("--sequence", action="store_true", help="Proximity mode: targets of each file are frames of one mesh sequence (see transfer_by_proximity)")
+    parser.add_argument("--candidates", type=int, default=0, help="Proximity mode: one to one match considering this many nearest source elements (0 = off)")
+    parser.add_argument("--max-memory", type=int, default=0, help="Proximity/uv mode: stream each target through queries sized to stay around this many MB (0 = off)")
+    parser.add_argument("--scope", choices=["all", "selected", "islands"], default="all", help="Match and reorder only selected faces or listed islands of targets, rest keeps its order")
+    parser.add_argument("--islands", default="", help="Island numbers for --scope islands, e.g. 0,3-5")
+    parser.add_argument("--verify", action="store_true", help="Compare each reordered target with source and add match percentages and differing islands to report")
+    parser.add_argument("--workers", type=int, default=1, help="Number of background blender processes")
+    parser.add_argument("--output-dir", help="Save reordered files to this folder instead of overwriting targets")
+    parser.add_argument("--report", help="Write json report to this file (default: print it)")
+    return parser.parse_args(argv)
+
+
+def _batch_worker_argv(args):
+    argv = ["--source-object", args.source_object, "--objects", *args.objects, "--mode", args.mode, "--workers", "1"]
+    if args.source_file:
+        argv += ["--source-file", os.path.abspath(args.source_file)]
+    if args.delta is not None:
+        argv += ["--delta", str(args.delta)]
+    if args.derive_from_verts:
+        argv.append("--derive-from-verts")
+    if args.candidates:
+        argv += ["--candidates", str(args.candidates)]
+    if args.sequence:
+        argv.append("--sequence")
+    if args.anchors is not None:
+        argv += ["--anchors", str(args.anchors)]
+    if args.max_memory:
+        argv += ["--max-memory", str(args.max_memory)]
+    if args.scope != "all":
+        argv += ["--scope", args.scope, "--islands", args.islands]
+    if args.verify:
+        argv.append("--verify")
+    if args.output_dir:
+        argv += ["--output-dir", os.path.abspath(args.output_dir)]
+    return argv
+
+
+def _batch_load_source(args):
+    if not args.source_file:
+        return bpy.data.objects[args.source_object]
+    with bpy.data.libraries.load(os.path.abspath(args.source_file), link=True) as (data_from, data_to):
+        data_to.objects = [args.source_object]
+    if data_to.objects[0] is None:
+        raise KeyError("Object "+args.source_object+" not found in "+args.source_file)
+    return data_to.objects[0]
+
+
+def batch_process_files(files, args):
+    """Reorder target objects of each file in this blender process. Returns report entries"""
+    transfer = TRANSFER_MODES[args.mode.upper()]
+    options = {}
+    if args.delta is not None and args.mode != "topology":
+        options["delta"] = args.delta
+    if args.derive_from_verts and args.mode == "proximity":
+        options["derive_from_verts"] = True
+    if args.candidates and args.mode == "proximity":
+        options["candidates"] = args.candidates
+    if args.sequence and args.mode == "proximity":
+        options["sequence"] = True
+    if args.anchors is not None and args.mode == "hybrid":
+        options["anchors"] = args.anchors
+    if args.max_memory and args.mode in ("proximity", "uv"):
+        options["max_memory"] = args.max_memory
+    if args.scope != "all":
+        options["scope"] = transfer_scope(args.scope.upper(), args.islands)
+
+    entries = []
+    for filepath in files:
+        try:
+            bpy.ops.wm.open_mainfile(filepath=filepath)
+            source = _batch_load_source(args)
+            targets, meshes = [], set()
+            for obj in bpy.data.objects:
+                if obj.type == 'MESH' and obj != source and obj.library is None and obj.data not in meshes \
+                        and any(fnmatch(obj.name, pattern) for pattern in args.objects):
+                    meshes.add(obj.data)  # reorder shared meshes only once
+                    targets.append(obj)
+            log = MessageLog()
+            results = transfer(source, targets, reporter=log, **options)
+            reports = dict(verify_vert_order(source, [result.target for result in results])) if args.verify else {}
+            if log.messages:
+                entries.append({"file": filepath, "warnings": [message for _, message in log.messages]})
+            for result in results:
+                mesh = result.target.data
+                entries.append({
+                    "file": filepath, "object": result.target.name,
+                    "counts": [len(mesh.vertices), len(mesh.edges), len(mesh.polygons)],
+                    "matched": list(result.matched),
+                    "unmatched_islands": result.unmatched_islands,
+                    "seconds": round(result.seconds, 4),
+                })
+                if result.peak_bytes is not None:
+                    entries[-1]["peak_mb"] = round(result.peak_bytes / 2 ** 20, 1)
+                if args.verify:
+                    report = reports[result.target]
+                    entries[-1]["verify"] = {
+                        "percent": [round(percentage, 4) for percentage in verify_percentages(report)],
+                        "equal": [report.verts, report.edges, report.faces],
+                        "mismatched_islands": report.mismatched_islands,
+                    }
+            if args.output_dir:
+                os.makedirs(args.output_dir, exist_ok=True)
+                bpy.ops.wm.save_as_mainfile(filepath=os.path.join(args.output_dir, os.path.basename(filepath)))
+            else:
+                bpy.ops.wm.save_mainfile()
+        except Exception as e:
+            entries.append({"file": filepath, "error": repr(e)})
+    return entries
+
+
+def batch_run_workers(files, args):
+    """Spread files over args.workers background blender processes, merge their reports"""
+    workers = []
+    report_dir = tempfile.mkdtemp(prefix="vert_order_")
+    for i in range(min(args.workers, len(files))):
+        chunk = files[i::args.workers]
+        report_path = os.path.join(report_dir, "worker_"+str(i)+".json")
+        cmd = [bpy.app.binary_path, "-b", "--factory-startup", "--python", BATCH_SCRIPT, "--",
+               *_batch_worker_argv(args), "--report", report_path, *chunk]
+        workers.append((subprocess.Popen(cmd), report_path, chunk))
+
+    entries = []
+    for process, report_path, chunk in workers:
+        process.wait()
+        try:
+            with open(report_path) as f:
+                entries += json.load(f)["targets"]
+            os.remove(report_path)
+        except (OSError, ValueError):
+            entries += [{"file": filepath, "error": "worker exited with code "+str(process.returncode)} for filepath in chunk]
+    if not os.listdir(report_dir):
+        os.rmdir(report_dir)
+    return entries
+
+
+BATCH_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__main__.py")
+
+
+def batch_main(argv):
+    """Command line entry point: blender -b --python transfer_vertex_order/__main__.py -- [options] targets"""
+    args = batch_parse_args(argv)
+    files = sorted({os.path.abspath(path) for pattern in args.targets for path in (glob.glob(pattern) or [pattern])})
+    start_time = time.perf_counter()
+    if os.environ.get("VOT_PROFILE", "") not in ("", "0"):
+        profiler.start()
+    if args.workers > 1 and len(files) > 1:
+        entries = batch_run_workers(files, args)
+    else:
+        entries = batch_process_files(files, args)
+
+    report = json.dumps({
+        "version": list(bl_info["version"]),
+        "mode": args.mode,
+        "source": {"object": args.source_object, "file": args.source_file},
+        "seconds": round(time.perf_counter() - start_time, 4),
+        "targets": entries,
+        "stages": [{"name": name, "seconds": round(seconds, 4), "calls": calls, "elements": elements}
+                   for name, seconds, calls, elements in profiler.summary()],
+    }, indent=2)
+    if args.report:
+        with open(args.report, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+    return 1 if any("error" in entry for entry in entries) else 0
+
+
+panels = (
+    VOT_PT_CopyVertIds,
+)
+
+def update_panel(self, context):
+    message = "Vertex Order: Updating Panel locations has failed"
+    try:
+        for panel in panels:
+            if "bl_rna" in panel.__dict__:
+                bpy.utils.unregister_class(panel)
+
+        for panel in panels:
+            panel.bl_category = context.preferences.addons[__package__].preferences.category
+            bpy.utils.register_class(panel)
+
+    except Exception as e:
+        print("\n[{}]\n{}\n\nError:\n{}".format(__name__, message, e))
+        pass
+
+
+def update_index_cache(self, context):
+    source_index_cache.max_bytes = self.index_cache_size << 20
+    source_index_cache.trim()
+
+
+class WertOrderPreferences(bpy.types.AddonPreferences):
+    # this must match the addon name, use '__package__'
+    # when defining this in a submodule of a python package.
+    bl_idname = __package__
+
+    category: bpy.props.StringProperty( name="Tab Category", description="Choose a name for the category of the panel", default="Tools", update=update_panel )
+    use_profiling: BoolProperty(name="Profile Operators", description="Report time of each stage (read, index, match, repair, write back) after every operator and save json trace (chrome://tracing). Same as VOT_PROFILE environment variable", default=False)
+    index_cache_size: bpy.props.IntProperty(name="Source Index Cache (MB)", description="Memory kept for source search indices between operator runs, so repeated transfers from same source skip building them (0 = no cache)", default=512, min=0, update=update_index_cache)
+    auto_verify: BoolProperty(name="Verify After Transfer", description="Compare every reordered target with source after transfer operators and report match percentages and differing islands", default=False)
+    profile_trace_path: bpy.props.StringProperty(name="Trace File", description="Where to save profile trace (empty = system temp folder)", default="", subtype='FILE_PATH')
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row()
+        col = row.column()
+        col.label(text="Tab Category:")
+        col.prop(self, "category", text="")
+        col.prop(self, "index_cache_size")
+        col.prop(self, "auto_verify")
+        col.prop(self, "use_profiling")
+        if self.use_profiling:
+            col.prop(self, "profile_trace_path")
+
+
+classes = (
+    WertOrderPreferences,
+    VOT_OT_TransferVertId,
+    VOT_OT_TransferVertIdByUV,
+    VOT_OT_TransferVertIdByTopology,
+    VOT_OT_TransferVertIdByAnchors,
+    VOT_OT_VerifyVertOrder,
+    VOT_OT_CopyVertID,
+    VOT_OT_PasteVertID,
+    VOT_OT_SaveVertOrderMap,
+    VOT_OT_ApplyVertOrderMap,
+    VOT_PT_CopyVertIds,
+)
+
+def register():
+    bpy.types.Scene.copy_indices = CopyIDs()
+    # bpy.ops.wm.addon_enable(module="space_view3d_copy_attributes")
+
+    from bpy.utils import register_class
+    for cls in classes:
+        register_class(cls)
+    update_panel(None, bpy.context)
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon:
+        update_index_cache(addon.preferences, bpy.context)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_source_index_cache)
+
+
+def unregister():
+    if invalidate_source_index_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_source_index_cache)
+    source_index_cache.invalidate()
+    from bpy.utils import unregister_class
+    for cls in reversed(classes):
+        unregister_class(cls)
+    del bpy.types.Scene.copy_indices
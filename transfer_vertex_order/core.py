@@ -0,0 +1,1632 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Matching core of Transfer Vert Order - plain numpy, no bpy/bmesh, so it can run in worker processes
+and be used or profiled outside of blender.
+
+Meshes are described by MeshArrays (positions, edge verts, polygon loop starts/totals, loop verts/edges, UVs),
+matches are returned as index maps (target element -> source element, -1 = not matched) and turned into
+permutation arrays (new index of every element) by complete_index_map, plus polygon corner rotation
+(see corner_order) that lines up loops of matched polygons with source.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+import tracemalloc
+from array import array
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager, nullcontext
+from itertools import islice, product
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:  # scipy is not shipped with blender - SpatialIndex falls back to numpy spatial grid
+    cKDTree = None
+    connected_components = None
+
+
+class StageProfiler():
+    """Wall time of named stages, off by default (disabled stage() returns one shared no-op context).
+    Stages can nest and run on worker threads - each record is (name, count, target, start, end, thread id)"""
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._lock = threading.Lock()
+        self._noop = nullcontext()
+
+    def start(self):
+        self.records = []
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def stage(self, name, count=None, target=None):
+        """Context manager timing one stage, count = number of processed elements"""
+        if not self.enabled:
+            return self._noop
+        return self._record(name, count, target)
+
+    @contextmanager
+    def _record(self, name, count, target):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.records.append((name, count, target, start, end, threading.get_ident()))
+
+    def summary(self):
+        """[(name, seconds, calls, elements)] slowest first. Nested stages are included in parent time"""
+        totals = {}
+        for name, count, target, start, end, tid in self.records:
+            seconds, calls, elements = totals.get(name, (0.0, 0, 0))
+            totals[name] = (seconds + end - start, calls + 1, elements + (count or 0))
+        return sorted(((name,) + total for name, total in totals.items()), key=lambda row: -row[1])
+
+    def summary_lines(self):
+        return ['{}: {:.4f}s, {} calls, {} elements'.format(*row) for row in self.summary()]
+
+    def write_trace(self, path):
+        """Save records as chrome://tracing / Perfetto json (complete events, microseconds)"""
+        origin = min((record[3] for record in self.records), default=0.0)
+        events = [{"name": name, "ph": "X", "pid": os.getpid(), "tid": tid,
+                   "ts": round((start - origin) * 1e6, 1), "dur": round((end - start) * 1e6, 1),
+                   "args": {"count": count, "target": target}}
+                  for name, count, target, start, end, tid in self.records]
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+profiler = StageProfiler()
+
+
+def run_steps(steps):
+    """Run step generator to the end at once, returns its return value"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def scaled_steps(steps, start, end):
+    """Yield progress of nested step generator mapped to start..end, returns its return value"""
+    while True:
+        try:
+            fraction = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        yield start + (end - start) * fraction
+
+
+MeshArrays = namedtuple("MeshArrays", "co edge_verts loop_start loop_total loop_verts loop_edges face_hidden uvs")
+MeshArrays.__new__.__defaults__ = (None, None)
+MeshArrays.__doc__ = """Mesh as plain arrays - vert positions (n, 3), edge verts (n, 2), polygon loop start/total,
+loop vert/edge indices (loops stored in polygon order), optional polygon hide flags and loop uvs (n, 2)"""
+
+
+def mesh_from_polygons(co, loop_total, loop_verts, uvs=None):
+    """MeshArrays from vert positions and polygon corners, edges are numbered in order of first use"""
+    loop_total = np.asarray(loop_total, dtype=np.int32)
+    loop_verts = np.asarray(loop_verts, dtype=np.int32)
+    loop_start = (np.cumsum(loop_total) - loop_total).astype(np.int32)
+    pairs = np.sort(np.column_stack((loop_verts, loop_verts[next_loops(loop_start, loop_total)])), axis=1)
+    edge_verts, first, inverse = np.unique(pairs, axis=0, return_index=True, return_inverse=True)
+    by_first_use = np.argsort(first, kind='stable')
+    loop_edges = invert_permutation(by_first_use)[inverse.ravel()].astype(np.int32)
+    return MeshArrays(np.asarray(co, dtype=np.float32).reshape(-1, 3), edge_verts[by_first_use].astype(np.int32),
+                      loop_start, loop_total, loop_verts, loop_edges, None, uvs)
+
+
+def next_loops(loop_start, loop_total):
+    """Next loop of every loop inside its polygon (step=-1 for previous)"""
+    return _step_loops(loop_start, loop_total, 1)
+
+
+def prev_loops(loop_start, loop_total):
+    return _step_loops(loop_start, loop_total, -1)
+
+
+def _step_loops(loop_start, loop_total, step):
+    loop_start = np.asarray(loop_start, dtype=np.int64)
+    loop_total = np.asarray(loop_total, dtype=np.int64)
+    start = np.repeat(loop_start, loop_total)
+    total = np.repeat(loop_total, loop_total)
+    return start + (np.arange(len(start)) - start + step) % total
+
+
+def face_centers(mesh):
+    """Median center of every polygon (same as MeshPolygon.center)"""
+    if not len(mesh.loop_start):
+        return np.zeros((0, 3))
+    corners = mesh.co[mesh.loop_verts].astype(np.float64)
+    return np.add.reduceat(corners, mesh.loop_start, axis=0) / mesh.loop_total[:, None]
+
+
+def face_normal(mesh, face):
+    """Newell normal of polygon (not normalized)"""
+    start, total = int(mesh.loop_start[face]), int(mesh.loop_total[face])
+    corners = mesh.co[mesh.loop_verts[start:start + total]].astype(np.float64)
+    return np.cross(corners, np.roll(corners, -1, axis=0)).sum(axis=0)
+
+
+class LoopGraph():
+    """Loop connectivity of MeshArrays used by flood fill, as lists for fast per element access.
+    radial is the other loop of edge used by two polygons, -1 for boundary and -2 for non manifold edges"""
+
+    def __init__(self, mesh):
+        loop_edges = np.asarray(mesh.loop_edges, dtype=np.int64)
+        self.face = np.repeat(np.arange(len(mesh.loop_total)), mesh.loop_total).tolist()
+        self.next = next_loops(mesh.loop_start, mesh.loop_total).tolist()
+        self.prev = prev_loops(mesh.loop_start, mesh.loop_total).tolist()
+        self.verts = np.asarray(mesh.loop_verts).tolist()
+        self.edges = loop_edges.tolist()
+        self.loop_start = np.asarray(mesh.loop_start).tolist()
+        self.loop_total = np.asarray(mesh.loop_total).tolist()
+        self.hidden = np.asarray(mesh.face_hidden, dtype=bool).tolist() if mesh.face_hidden is not None else None
+
+        # loops grouped by edge - loop at rank r of edge e is edge_loops[edge_start[e] + r]
+        uses = np.bincount(loop_edges, minlength=len(mesh.edge_verts))
+        self.edge_loops = np.argsort(loop_edges, kind='stable')
+        self.edge_start = np.cumsum(uses) - uses
+        self.edge_uses = uses
+        rank = np.empty(len(loop_edges), dtype=np.int64)
+        rank[self.edge_loops] = np.arange(len(loop_edges)) - np.repeat(self.edge_start, uses)
+        radial = np.full(len(loop_edges), -1, dtype=np.int64)
+        manifold = uses[loop_edges] == 2
+        radial[manifold] = self.edge_loops[self.edge_start[loop_edges[manifold]] + 1 - rank[manifold]]
+        radial[uses[loop_edges] > 2] = -2
+        self.radial = radial.tolist()
+
+    def face_loops(self, face):
+        return range(self.loop_start[face], self.loop_start[face] + self.loop_total[face])
+
+    def edge_faces(self, edge):
+        start = self.edge_start[edge]
+        return [self.face[loop] for loop in self.edge_loops[start:start + self.edge_uses[edge]].tolist()]
+
+    def ordered_loops(self, edge_loop, vert1):
+        """Loops of edge_loop polygon, ordered vert1 -> other vert of edge_loop edge -> ... around the polygon.
+        Returns (loops, forward) - forward is False when that order is against polygon winding"""
+        if self.verts[edge_loop] == vert1:
+            loop, step, forward = edge_loop, self.next, True
+        else:
+            loop, step, forward = self.next[edge_loop], self.prev, False
+        face_loops = []
+        for _ in range(self.loop_total[self.face[edge_loop]]):
+            face_loops.append(loop)
+            loop = step[loop]
+        return face_loops, forward
+
+
+class FloodFillError(ValueError):
+    """Flood fill can not continue, faces are the polygons causing it (to show them to user)"""
+
+    def __init__(self, message, faces=()):
+        super().__init__(message)
+        self.faces = list(faces)
+
+
+class ParsedFaces():
+    """Flood fill result in traversal order. Per face loop, vert and edge indices are stored in flat
+    parallel arrays, face j owns range offsets[j]:offsets[j+1] (verts/edges/loops start at shared edge)"""
+
+    def __init__(self):
+        self.faces = array('i')
+        self.offsets = array('i', [0])
+        self.loops = array('i')
+        self.verts = array('i')
+        self.edges = array('i')
+
+    def __len__(self):
+        return len(self.faces)
+
+    def face_slice(self, j):
+        return slice(self.offsets[j], self.offsets[j + 1])
+
+    def add_face(self, graph, face, face_loops, forward):
+        self.faces.append(face)
+        self.loops.extend(face_loops)
+        self.verts.extend(graph.verts[loop] for loop in face_loops)
+        if forward:
+            self.edges.extend(graph.edges[loop] for loop in face_loops)
+        else:
+            self.edges.extend(graph.edges[graph.prev[loop]] for loop in face_loops)
+        self.offsets.append(len(self.verts))
+
+
+def flood_fill(mesh, graph, active_face, second_face, flip_normal=False):
+    """Parse all faces connected to two adjacent faces, breadth first. Traversal direction on the shared edge
+    comes from active face normal (flip_normal to reverse it), so both meshes have to be seeded the same way.
+    Returns ParsedFaces, raises FloodFillError"""
+    second_edges = {graph.edges[loop] for loop in graph.face_loops(second_face)}
+    shared = [loop for loop in graph.face_loops(active_face) if graph.edges[loop] in second_edges]
+    if len(shared) != 1 or active_face == second_face:
+        raise FloodFillError("Two faces should share one edge")
+    edge = graph.edges[shared[0]]
+
+    # pick first vert of shared edge so active face is on the same side of it in both meshes
+    vert_0, vert_1 = (int(v) for v in mesh.edge_verts[edge])
+    co_0, co_1 = mesh.co[vert_0].astype(np.float64), mesh.co[vert_1].astype(np.float64)
+    normal = -face_normal(mesh, active_face) if flip_normal else face_normal(mesh, active_face)
+    center = mesh.co[[graph.verts[loop] for loop in graph.face_loops(active_face)]].astype(np.float64).mean(axis=0)
+    edge_vec = co_1 - co_0
+    side_vec = co_0 + edge_vec * 0.5 - center
+    vert1 = vert_0 if np.dot(np.cross(side_vec, edge_vec), normal) > 0 else vert_1
+
+    parsed = ParsedFaces()
+    used_faces = bytearray(len(graph.loop_total))
+    faces_to_parse = []
+    for face in (active_face, second_face):
+        edge_loop = next(loop for loop in graph.face_loops(face) if graph.edges[loop] == edge)
+        face_loops, forward = graph.ordered_loops(edge_loop, vert1)
+        parsed.add_face(graph, face, face_loops, forward)
+        used_faces[face] = 1
+        faces_to_parse.append((face_loops, forward))
+
+    # faces across each edge of parsed faces, in face edge order
+    verts, prev, radial, face_of, hidden = graph.verts, graph.prev, graph.radial, graph.face, graph.hidden
+    while faces_to_parse:
+        new_parsed_faces = []
+        for face_loops, forward in faces_to_parse:
+            last = len(face_loops) - 1
+            for i, loop in enumerate(face_loops):
+                edge_loop = loop if forward else prev[loop]  # loop which edge is i-th edge of face
+                radial_loop = radial[edge_loop]
+                if radial_loop == -1:
+                    continue  # boundary edge
+                if radial_loop == -2:
+                    raise FloodFillError("More than 2 faces share edge", graph.edge_faces(graph.edges[edge_loop]))
+                shared_face = face_of[radial_loop]
+                if used_faces[shared_face] or (hidden and hidden[shared_face]):
+                    continue
+                # get vertices of the edge - first one is the one earlier in face vert order
+                vert1 = verts[face_loops[0]] if i == last else verts[loop]
+                shared_loops, shared_forward = graph.ordered_loops(radial_loop, vert1)
+                parsed.add_face(graph, shared_face, shared_loops, shared_forward)
+                used_faces[shared_face] = 1
+                new_parsed_faces.append((shared_loops, shared_forward))
+        faces_to_parse = new_parsed_faces
+    return parsed
+
+
+def _as_points(points):
+    """Contiguous float64 (n, dim) array of points, empty input keeps its dimension (3 if unknown)"""
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    if not points.size:
+        return points.reshape(0, points.shape[-1] if points.ndim > 1 and points.shape[-1] else 3)
+    return points.reshape(len(points), -1)
+
+
+class SpatialIndex():
+    """Nearest neighbour search over (n, dim) array of points.
+    Uses scipy cKDTree when it is available, pure numpy spatial grid otherwise"""
+
+    GRID_CELL_POINTS = 2  # target mean points per occupied cell of finest grid
+    GRID_POINTS = 1 << 15  # query points per chunk of neighbour cell lookups
+    GRID_BATCH = 1 << 21  # candidate pairs per batch
+
+    def __init__(self, points):
+        self.points = _as_points(points)
+        self.tree = cKDTree(self.points) if cKDTree is not None and len(self.points) else None
+        self._grids = {}  # cell size -> grid, see _grid
+        self._base_cell = None
+
+    def __len__(self):
+        return len(self.points)
+
+    @property
+    def nbytes(self):
+        """Approximate memory used by index"""
+        return self.points.nbytes + self.tree_nbytes + sum(sum(part.nbytes for part in grid) for grid in self._grids.values())
+
+    @property
+    def tree_nbytes(self):
+        """Approximate memory of kd tree (allocated outside of python, keeps its own copy of points and index array)"""
+        return self.points.nbytes + len(self.points) * 8 if self.tree is not None else 0
+
+    def query(self, points, max_dist, workers=-1):
+        """Return (dist, index) of nearest point for each of points. Index is -1 (and dist inf) if nothing is closer than max_dist.
+        workers - threads used by cKDTree (-1 = all cores)"""
+        points = _as_points(points)
+        dist = np.full(len(points), np.inf)
+        index = np.full(len(points), -1, dtype=np.int64)
+        if not len(points) or not len(self.points) or max_dist <= 0:
+            return dist, index
+        if self.tree is not None:
+            found_dist, found = self.tree.query(points, k=1, distance_upper_bound=max_dist, workers=workers)
+            hit = found_dist < max_dist
+            dist[hit] = found_dist[hit]
+            index[hit] = found[hit]
+            return dist, index
+        return self._grid_query(points, max_dist, dist, index)
+
+    def query_k(self, points, k, max_dist, workers=-1):
+        """Return (dist, index) arrays (n, k) of up to k nearest points closer than max_dist, nearest first.
+        Missing neighbours have index -1 and dist inf"""
+        points = _as_points(points)
+        dist = np.full((len(points), k), np.inf)
+        index = np.full((len(points), k), -1, dtype=np.int64)
+        if not len(points) or not len(self.points) or max_dist <= 0 or k < 1:
+            return dist, index
+        if self.tree is not None:
+            found_dist, found = self.tree.query(points, k=k, distance_upper_bound=max_dist, workers=workers)
+            found_dist, found = found_dist.reshape(len(points), k), found.reshape(len(points), k)
+            hit = found_dist < max_dist
+            dist[hit] = found_dist[hit]
+            index[hit] = found[hit]
+            return dist, index
+        return self._grid_query_k(points, k, max_dist, dist, index)
+
+    def _min_cell_size(self):
+        # keeps linear cell ids of all 3^dim neighbours within int64 (see _grid)
+        extent = float(np.ptp(self.points, axis=0).max())
+        return extent / 2 ** (60 // self.points.shape[1] - 2) or 1.0
+
+    def _base_cell_size(self):
+        """Finest grid level - cells holding a few points each, following point density rather than search radius"""
+        if self._base_cell is None:
+            extent = float(np.ptp(self.points, axis=0).max())
+            cell_size = max(extent / len(self.points) ** (1.0 / self.points.shape[1]), self._min_cell_size())
+            # points on surfaces crowd into fewer cells than a volume would - shrink cells as if occupied cells
+            # scale with area, until they hold GRID_CELL_POINTS on average
+            while True:
+                crowding = len(self.points) / (self.GRID_CELL_POINTS * len(self._grid(cell_size)[3]))
+                if crowding <= 1 or cell_size / 2 < self._min_cell_size():
+                    break
+                del self._grids[cell_size]
+                cell_size = max(cell_size / max(crowding ** 0.5, 2), self._min_cell_size())
+            self._base_cell = cell_size
+        return self._base_cell
+
+    def _cell_sizes(self, max_dist):
+        """Grid levels searched for max_dist: doubling from _base_cell_size, last one is max_dist itself"""
+        cell_size = self._base_cell_size()
+        while cell_size < max_dist:
+            yield cell_size
+            cell_size *= 2
+        yield max(max_dist, self._min_cell_size())
+
+    def _grid(self, cell_size):
+        """(origin, dims, strides, sorted occupied cell ids, cell starts, point order) of grid over points.
+        Cell id is linear index in grid padded by 2 cells on each side, so ids of neighbour cells only differ by constant"""
+        grid = self._grids.get(cell_size)
+        if grid is None:
+            origin = self.points.min(axis=0)
+            dims = np.floor(np.ptp(self.points, axis=0) / cell_size).astype(np.int64) + 1
+            strides = np.cumprod(np.append(1, dims[:0:-1] + 4))[::-1]
+            keys = (np.floor((self.points - origin) / cell_size).astype(np.int64) + 2) @ strides
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            starts = np.flatnonzero(np.diff(keys, prepend=-1))
+            grid = self._grids[cell_size] = (origin, dims, strides, keys[starts], np.append(starts, len(keys)), order)
+        return grid
+
+    def _candidates(self, points, todo, cell_size, reach2):
+        """Yield (query, candidate) index arrays pairing points[todo] with points in their own and neighbour cells,
+        at most about GRID_BATCH pairs at a time. Every candidate closer than cell_size is there.
+        Cells further than reach2[query] (squared distance) are skipped - it is read lazily, so the caller can
+        shrink it with what it finds in own cells, which go first"""
+        origin, dims, strides, cell_keys, cell_starts, order = self._grid(cell_size)
+        dim = points.shape[1]
+        offsets = np.array(sorted(product((-1, 0, 1), repeat=dim), key=np.count_nonzero), dtype=np.int64)
+        # picks lower, none or upper cell gap along each axis for each offset
+        select = np.zeros((len(offsets), 3, dim))
+        select[np.arange(len(offsets))[:, None], offsets + 1, np.arange(dim)] = 1
+        select = select.reshape(len(offsets), -1) * (cell_size * cell_size * (1 - 1e-9))  # some slack for rounding
+        scaled = np.clip((np.take(points, todo, axis=0) - origin) / cell_size, -2, dims + 1)
+        cells = np.floor(scaled).astype(np.int64)
+        keys = (cells + 2) @ strides
+        # points more than a cell outside of grid have no neighbours, sorted keys make searchsorted cache friendly
+        by_key = np.argsort(keys)
+        by_key = by_key[np.all((cells[by_key] >= -1) & (cells[by_key] <= dims), axis=1)]
+        for chunk in range(0, len(by_key), self.GRID_POINTS):
+            chunk_points = by_key[chunk:chunk + self.GRID_POINTS]
+            query, chunk_keys = todo[chunk_points], keys[chunk_points]
+            inside = (np.take(scaled, chunk_points, axis=0) - np.take(cells, chunk_points, axis=0)).T
+            axis_gap2 = np.concatenate((inside * inside, np.zeros_like(inside), (1.0 - inside) ** 2))
+            for group in (slice(0, 1), slice(1, None)):
+                which, near = np.nonzero(select[group] @ axis_gap2 < reach2[query])
+                neighbours = chunk_keys[near] + offsets[group][which] @ strides
+                cell = np.minimum(np.searchsorted(cell_keys, neighbours), len(cell_keys) - 1)
+                hit = cell_keys[cell] == neighbours
+                near, cell = near[hit], cell[hit]
+                counts = cell_starts[cell + 1] - cell_starts[cell]
+                ends = np.cumsum(counts)
+                start = 0
+                while start < len(counts):
+                    stop = max(int(np.searchsorted(ends, (ends[start - 1] if start else 0) + self.GRID_BATCH, side='right')), start + 1)
+                    batch_counts = counts[start:stop]
+                    first = np.repeat(cell_starts[cell[start:stop]] - np.cumsum(batch_counts) + batch_counts, batch_counts)
+                    yield np.repeat(query[near[start:stop]], batch_counts), order[first + np.arange(len(first))]
+                    start = stop
+
+    def _distances2(self, points, query, cand):
+        # take of rows is a lot faster than fancy indexing
+        diff = np.take(points, query, axis=0) - np.take(self.points, cand, axis=0)
+        return np.einsum('ij,ij->i', diff, diff)
+
+    def _grid_query(self, points, max_dist, dist, index):
+        # grid levels from fine to coarse - neighbour cells of size s hold everything closer than s,
+        # so points with a match closer than that are done, the rest go on to the next level
+        best = np.full(len(points), max_dist * max_dist)
+        todo = np.arange(len(points))
+        for cell_size in self._cell_sizes(max_dist):
+            if not len(todo):
+                break
+            for query, cand in self._candidates(points, todo, cell_size, best):
+                d2 = self._distances2(points, query, cand)
+                near = d2 < best[query]
+                query, cand, d2 = query[near], cand[near], d2[near]
+                np.minimum.at(best, query, d2)
+                nearest = d2 == best[query]
+                index[query[nearest]] = cand[nearest]
+            todo = todo[best[todo] >= cell_size * cell_size]
+        hit = index >= 0
+        dist[hit] = np.sqrt(best[hit])
+        return dist, index
+
+    def _grid_query_k(self, points, k, max_dist, dist, index):
+        # grid levels as in _grid_query, keeping k nearest found so far per point - done once k-th is closer than cell size
+        max_d2 = max_dist * max_dist
+        d2 = np.full((len(points), k), max_d2)
+        todo = np.arange(len(points))
+        for cell_size in self._cell_sizes(max_dist):
+            if not len(todo):
+                break
+            for query, cand in self._candidates(points, todo, cell_size, d2[:, -1]):
+                found_d2 = self._distances2(points, query, cand)
+                # coarser levels bring candidates kept from finer ones again
+                near = (found_d2 < d2[query, -1]) & (index[query] != cand[:, None]).all(axis=1)
+                if not near.any():
+                    continue
+                # merge with k kept so far of the same points
+                rows = np.unique(query[near])
+                kept = index[rows].ravel() >= 0
+                query = np.concatenate((np.repeat(rows, k)[kept], query[near]))
+                cand = np.concatenate((index[rows].ravel()[kept], cand[near]))
+                found_d2 = np.concatenate((d2[rows].ravel()[kept], found_d2[near]))
+                by_distance = np.lexsort((found_d2, query))
+                query, cand, found_d2 = query[by_distance], cand[by_distance], found_d2[by_distance]
+                rank = np.arange(len(cand)) - np.searchsorted(query, query, side='left')
+                keep = rank < k
+                index[rows], d2[rows] = -1, max_d2
+                index[query[keep], rank[keep]] = cand[keep]
+                d2[query[keep], rank[keep]] = found_d2[keep]
+            todo = todo[d2[todo, -1] >= cell_size * cell_size]
+        hit = index >= 0
+        dist[hit] = np.sqrt(d2[hit])
+        return dist, index
+
+
+def content_fingerprint(*arrays):
+    """Cheap content hash of arrays - shapes, dtypes and raw buffers"""
+    digest = hashlib.blake2b(digest_size=16)
+    for values in arrays:
+        values = np.ascontiguousarray(values)
+        digest.update(str((values.shape, values.dtype.str)).encode())
+        digest.update(values.data)
+    return digest.digest()
+
+
+class SourceIndexCache():
+    """Session LRU cache of built source indices, so rerunning transfer (e.g. redo with other delta) skips building them.
+    Entries are keyed by (object name, kind) and only returned while content fingerprint of arrays they were built from
+    is the same. Least recently used entries are dropped above max_bytes, entries of edited objects by depsgraph handler"""
+
+    def __init__(self, max_bytes=512 << 20):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # (object name, kind) -> (fingerprint, value)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, fingerprint, build):
+        """Cached value of key if it was built from same content, otherwise build() and cache it"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            self._entries.move_to_end(key)
+            return entry[1]
+        value = build()
+        if self.max_bytes > 0:
+            self._entries[key] = (fingerprint, value)
+            self._entries.move_to_end(key)
+            self.trim()
+        return value
+
+    def invalidate(self, name=None):
+        """Drop entries of object name (all entries if name is None)"""
+        for key in [key for key in self._entries if name is None or key[0] == name]:
+            del self._entries[key]
+
+    def trim(self):
+        # index sizes change (hash grids are built lazily per search radius) so they are measured on every trim
+        sizes = [(key, _cached_nbytes(value)) for key, (fingerprint, value) in self._entries.items()]
+        total = sum(size for key, size in sizes)
+        for key, size in sizes:
+            if total <= self.max_bytes:
+                break
+            del self._entries[key]
+            total -= size
+
+
+def _cached_nbytes(value):
+    values = value if isinstance(value, tuple) else (value,)
+    return sum(getattr(item, "nbytes", 0) for item in values)
+
+
+def match_nearest(src_index, points, delta, workers=-1):
+    """Map each of points to its nearest src_index point. -1 where nearest point is not closer than delta"""
+    dist, index = src_index.query(points, delta, workers)
+    index[~(dist < delta)] = -1
+    return index
+
+
+def match_nearest_steps(src_index, points, delta, workers=-1, chunk_size=0):
+    """Step generator version of match_nearest, queries chunk_size points per step (0 = all at once)"""
+    if not chunk_size or len(points) <= chunk_size:
+        return match_nearest(src_index, points, delta, workers)
+    index = np.empty(len(points), dtype=np.int64)
+    for start in range(0, len(points), chunk_size):
+        index[start:start + chunk_size] = match_nearest(src_index, points[start:start + chunk_size], delta, workers)
+        yield min(start + chunk_size, len(points)) / len(points)
+    return index
+
+
+def match_unique_steps(src_index, points, delta, candidates=4, workers=-1, chunk_size=0):
+    """Step generator of one to one matching - candidates nearest source points within delta are queried for all
+    points (chunk_size points per step), then conflicts are resolved globally by assign_one_to_one"""
+    dist = np.empty((len(points), candidates))
+    index = np.empty((len(points), candidates), dtype=np.int64)
+    step = chunk_size or max(len(points), 1)
+    for start in range(0, len(points), step):
+        dist[start:start + step], index[start:start + step] = src_index.query_k(points[start:start + step], candidates, delta, workers)
+        if chunk_size:
+            yield 0.9 * min(start + step, len(points)) / len(points)
+    return assign_one_to_one(dist, index, len(src_index))
+
+
+def match_predicted_steps(src_index, points, delta, predicted, search_steps, unique=False):
+    """Step generator keeping predicted matches (e.g. from previous frame of sequence) that are still closer than
+    delta, search_steps(src_index, points) runs only for the rest. unique - drop searched matches that take
+    source points of kept predictions"""
+    index = np.full(len(points), -1, dtype=np.int64)
+    if predicted is not None and len(predicted) == len(points):
+        predicted = np.asarray(predicted, dtype=np.int64)
+        with profiler.stage("check prediction", len(points)):
+            valid = np.flatnonzero(predicted >= 0)
+            diff = np.asarray(points[valid], dtype=np.float64) - src_index.points[predicted[valid]]
+            near = valid[np.einsum('ij,ij->i', diff, diff) < delta * delta]
+            index[near] = predicted[near]
+    rest = np.flatnonzero(index < 0)
+    if len(rest):
+        found = yield from search_steps(src_index, points[rest])
+        if unique and len(rest) < len(points):
+            found[np.isin(found, index[index >= 0])] = -1
+        index[rest] = found
+    return index
+
+
+def assign_one_to_one(dist, index, src_count):
+    """Injective index map from (n, k) nearest candidates (index -1 = none, rows sorted by distance).
+    Every round each free element proposes its nearest free candidate and each source keeps its nearest proposer -
+    first round accepts mutual nearest pairs, later ones resolve what was left. Elements out of candidates get -1"""
+    count, k = index.shape
+    result = np.full(count, -1, dtype=np.int64)
+    taken = np.zeros(src_count, dtype=bool)
+    valid = index.ravel() >= 0
+    pair_elements = np.repeat(np.arange(count), k)[valid]
+    pair_sources = index.ravel()[valid]
+    by_distance = np.lexsort((pair_sources, pair_elements, dist.ravel()[valid]))
+    pair_elements, pair_sources = pair_elements[by_distance], pair_sources[by_distance]
+    while len(pair_elements):
+        # first pair of every element is its nearest free candidate, np.unique returns them in element order
+        _, first = np.unique(pair_elements, return_index=True)
+        first.sort()  # back to distance order, so np.unique below keeps nearest proposer of each source
+        _, won = np.unique(pair_sources[first], return_index=True)
+        winners = first[won]
+        result[pair_elements[winners]] = pair_sources[winners]
+        taken[pair_sources[winners]] = True
+        free = (result[pair_elements] < 0) & ~taken[pair_sources]
+        pair_elements, pair_sources = pair_elements[free], pair_sources[free]
+    return result
+
+
+def repair_index_map(ids, processed):
+    """Turn per element ids into valid permutation of range(len(ids)) in O(n).
+    Processed elements claim their id first, then not processed elements keep their current id if it is still free.
+    Everything else (duplicates, out of range ids) gets spare ids in ascending order"""
+    ids = np.asarray(ids, dtype=np.int64)
+    processed = np.asarray(processed, dtype=bool)
+    count = len(ids)
+
+    order = np.concatenate((np.flatnonzero(processed), np.flatnonzero(~processed)))
+    claims = ids[order]
+    valid = (claims >= 0) & (claims < count)
+    order, claims = order[valid], claims[valid]
+    rank = np.arange(len(order))
+    first_claim = np.full(count, len(order), dtype=np.int64)
+    np.minimum.at(first_claim, claims, rank)
+    won = first_claim[claims] == rank
+
+    fixed_ids = np.full(count, -1, dtype=np.int64)
+    fixed_ids[order[won]] = claims[won]
+    used = np.zeros(count, dtype=bool)
+    used[claims[won]] = True
+
+    # every claimed id is unique, so there are exactly as many spare ids as elements without id
+    fixed_ids[fixed_ids < 0] = np.flatnonzero(~used)
+    if count and np.bincount(fixed_ids, minlength=count).max() != 1:
+        raise ValueError("Vertex order: repaired index map is not a bijection")
+    return fixed_ids
+
+
+def complete_index_map(id_map):
+    """Matched ids (-1 = not matched) -> permutation. Not matched elements keep their current index where possible"""
+    matched = id_map >= 0
+    return repair_index_map(np.where(matched, id_map, np.arange(len(id_map))), matched)
+
+
+def _mix64(values):
+    """splitmix64 finalizer - spreads small integers over whole uint64 range (wraps on overflow)"""
+    z = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _lookup_sorted(src_keys, keys):
+    """Index into src_keys for every key (-1 if missing) - hash join through sorted keys"""
+    order = np.argsort(src_keys, kind='stable')
+    sorted_keys = src_keys[order]
+    found = np.minimum(np.searchsorted(sorted_keys, keys), max(len(sorted_keys) - 1, 0))
+    result = np.full(len(keys), -1, dtype=np.int64)
+    if len(sorted_keys):
+        hit = sorted_keys[found] == keys
+        result[hit] = order[found[hit]]
+    return result
+
+
+def derive_edge_map(vert_map, edge_verts, src_edge_verts, src_vert_count):
+    """Match edges by their matched vert pair. -1 where edge vert was not matched or source has no such edge"""
+    mapped = vert_map[edge_verts]
+    valid = (mapped >= 0).all(axis=1)
+    mapped = np.sort(mapped, axis=1)
+    src_pairs = np.sort(src_edge_verts.astype(np.int64), axis=1)
+    keys = mapped[:, 0] * src_vert_count + mapped[:, 1]
+    edge_map = _lookup_sorted(src_pairs[:, 0] * src_vert_count + src_pairs[:, 1], keys)
+    edge_map[~valid] = -1
+    return edge_map
+
+
+def _face_vert_sets(loop_total, loop_verts):
+    """Order independent hash of every polygon vert set, and loop verts sorted inside each polygon"""
+    face_of_loop = np.repeat(np.arange(len(loop_total)), loop_total)
+    starts = np.cumsum(loop_total) - loop_total
+    hashes = np.add.reduceat(_mix64(loop_verts), starts) if len(starts) else np.zeros(0, dtype=np.uint64)
+    hashes ^= _mix64(loop_total.astype(np.int64) + (1 << 40))  # differentiate by vert count too
+    return hashes, loop_verts[np.lexsort((loop_verts, face_of_loop))], starts
+
+
+def derive_face_map(vert_map, faces, src_faces):
+    """Match polygons by their matched vert set. faces/src_faces are (loop_start, loop_total, loop_verts) tuples.
+    Assumes loops are stored in polygon order, like blender does. -1 where no source polygon has the same verts"""
+    _, loop_total, loop_verts = faces
+    _, src_loop_total, src_loop_verts = src_faces
+    mapped = vert_map[loop_verts]
+    valid = np.ones(len(loop_total), dtype=bool)
+    if len(mapped):
+        valid = np.logical_and.reduceat(mapped >= 0, np.cumsum(loop_total) - loop_total)
+    hashes, sorted_verts, starts = _face_vert_sets(loop_total, mapped)
+    src_hashes, src_sorted_verts, src_starts = _face_vert_sets(src_loop_total, src_loop_verts.astype(np.int64))
+    face_map = _lookup_sorted(src_hashes, hashes)
+    face_map[~valid] = -1
+
+    # verify hash hits on actual vert sets
+    hit = np.flatnonzero(face_map >= 0)
+    same_size = loop_total[hit] == src_loop_total[face_map[hit]]
+    face_map[hit[~same_size]] = -1
+    hit = hit[same_size]
+    totals = loop_total[hit]
+    if len(hit):
+        ramp = np.arange(int(totals.sum())) - np.repeat(np.cumsum(totals) - totals, totals)
+        loops = np.repeat(starts[hit], totals) + ramp
+        src_loops = np.repeat(src_starts[face_map[hit]], totals) + ramp
+        equal = np.logical_and.reduceat(sorted_verts[loops] == src_sorted_verts[src_loops], np.cumsum(totals) - totals)
+        face_map[hit[~equal]] = -1
+    return face_map
+
+
+def edge_midpoints(co, edge_verts):
+    return (co[edge_verts[:, 0]].astype(np.float64) + co[edge_verts[:, 1]]) * 0.5
+
+
+def face_uv_centers(mesh):
+    """Face UV center as 3d point, with winding of first three corners as z.
+    Winding deals with multiple faces with the same UV center (mainly mirrored meshes that have the same UVs
+    for both sides). It is not normalized, so it also differentiates by face size centers that otherwise might match"""
+    loop_start, loop_total = mesh.loop_start, mesh.loop_total
+    uvs = mesh.uvs.astype(np.float64)
+    centers = np.add.reduceat(uvs, loop_start, axis=0) / loop_total[:, None] if len(loop_start) else np.zeros((0, 2))
+    winding_1 = uvs[loop_start + 1] - uvs[loop_start]
+    winding_2 = uvs[loop_start + 2] - uvs[loop_start]
+    winding = winding_1[:, 0] * winding_2[:, 1] - winding_1[:, 1] * winding_2[:, 0]
+    return np.column_stack((centers, winding))
+
+
+def uv_face_hashes(mesh, precision):
+    """Hash of quantized UV corner sequence of every face, normalized for rotation by starting at the corner
+    with lowest (u, v). Corner order is kept, so mirrored faces (reversed winding) get different hashes.
+    Returns (hashes, rotation) - rotation is the offset of normalized first corner inside the face.
+    Assumes loops are stored in polygon order"""
+    loop_start, loop_total = mesh.loop_start, mesh.loop_total
+    quantized = np.round(mesh.uvs.astype(np.float64) / precision).astype(np.int64)
+    face_of_loop = np.repeat(np.arange(len(loop_total)), loop_total)
+    order = np.lexsort((quantized[:, 1], quantized[:, 0], face_of_loop))
+    rotation = order[loop_start] - loop_start if len(order) else np.zeros(0, dtype=np.int64)
+    corner = (np.arange(len(face_of_loop)) - loop_start[face_of_loop] - rotation[face_of_loop]) % loop_total[face_of_loop]
+    corner_keys = _mix64(quantized[:, 0]) ^ _mix64(quantized[:, 1] + (1 << 40))
+    loop_hashes = _mix64(corner_keys + _mix64(corner))
+    hashes = np.add.reduceat(loop_hashes, loop_start) if len(loop_start) else np.zeros(0, dtype=np.uint64)
+    return hashes ^ _mix64(loop_total.astype(np.int64)), rotation
+
+
+def match_uv_faces_exact(mesh, src, src_hashes, src_rotation, precision):
+    """Match faces by uv_face_hashes, verified on actual quantized corners. Source faces sharing hash
+    (stacked UVs) are ambiguous and left out. Returns (face_map with -1 where no match, rotation)"""
+    hashes, rotation = uv_face_hashes(mesh, precision)
+    _, first, counts = np.unique(src_hashes, return_index=True, return_counts=True)
+    unambiguous = first[counts == 1]
+    found = _lookup_sorted(src_hashes[unambiguous], hashes)
+    face_map = np.where(found >= 0, unambiguous[np.maximum(found, 0)], -1) if len(unambiguous) else np.full(len(hashes), -1)
+
+    loop_start, loop_total, loop_uvs = mesh.loop_start, mesh.loop_total, mesh.uvs
+    src_loop_start, src_loop_total, src_loop_uvs = src.loop_start, src.loop_total, src.uvs
+    hit = np.flatnonzero(face_map >= 0)
+    same_size = loop_total[hit] == src_loop_total[face_map[hit]]
+    face_map[hit[~same_size]] = -1
+    hit = hit[same_size]
+    if len(hit):
+        totals = loop_total[hit]
+        src_hit = face_map[hit]
+        ramp = np.arange(int(totals.sum())) - np.repeat(np.cumsum(totals) - totals, totals)
+        loops = np.repeat(loop_start[hit], totals) + (np.repeat(rotation[hit], totals) + ramp) % np.repeat(totals, totals)
+        src_loops = np.repeat(src_loop_start[src_hit], totals) + (np.repeat(src_rotation[src_hit], totals) + ramp) % np.repeat(totals, totals)
+        same_corner = (np.round(loop_uvs[loops].astype(np.float64) / precision) == np.round(src_loop_uvs[src_loops].astype(np.float64) / precision)).all(axis=1)
+        equal = np.logical_and.reduceat(same_corner, np.cumsum(totals) - totals)
+        face_map[hit[~equal]] = -1
+    return face_map, rotation
+
+
+def invert_permutation(perm):
+    inverse = np.empty_like(perm)
+    inverse[perm] = np.arange(len(perm), dtype=perm.dtype)
+    return inverse
+
+
+def corner_order(loop_start, loop_total, new_to_old_faces, rotation=None):
+    """Old loop index of every new loop, after polygons were reordered. Returns (loop order, new loop starts).
+    rotation - per old polygon, corner that becomes first corner of the new polygon (None = keep corner order)"""
+    totals = loop_total[new_to_old_faces]
+    starts = np.cumsum(totals) - totals
+    ramp = np.arange(int(totals.sum())) - np.repeat(starts, totals)
+    if rotation is not None:
+        ramp = (ramp + np.repeat(rotation[new_to_old_faces], totals)) % np.repeat(totals, totals)
+    order = np.repeat(loop_start[new_to_old_faces], totals) + ramp
+    return order, starts
+
+
+def loop_ids_from_faces(face_ids, loop_total, rotation=None, loop_start=None):
+    """New index of every loop, when loops follow reordered (and rotated, see corner_order) polygons.
+    Loops are assumed to be stored in polygon order unless loop_start is given"""
+    if loop_start is None:
+        loop_start = np.cumsum(loop_total) - loop_total
+    order, _ = corner_order(loop_start, loop_total, invert_permutation(np.asarray(face_ids, dtype=np.int64)), rotation)
+    return invert_permutation(order)
+
+
+def loop_faces(loop_start, loop_total):
+    """Polygon and corner (position inside polygon) of every loop"""
+    faces = np.repeat(np.arange(len(loop_total)), loop_total)
+    corners = np.arange(len(faces)) - np.repeat(np.cumsum(loop_total) - loop_total, loop_total)
+    loops = np.repeat(loop_start, loop_total) + corners
+    face_of_loop = np.empty(len(faces), dtype=np.int64)
+    corner_of_loop = np.empty(len(faces), dtype=np.int64)
+    face_of_loop[loops] = faces
+    corner_of_loop[loops] = corners
+    return face_of_loop, corner_of_loop
+
+
+def corner_rotation(loop_start, loop_total, loops, src_corners):
+    """Rotation of every polygon (see corner_order) that moves each of loops to corner src_corners of its polygon.
+    Polygons without any of loops keep their corner order (rotation 0)"""
+    loops = np.asarray(loops, dtype=np.int64)
+    faces, corners = loop_faces(loop_start, loop_total)
+    rotation = np.zeros(len(loop_total), dtype=np.int64)
+    face = faces[loops]
+    rotation[face] = (corners[loops] - np.asarray(src_corners, dtype=np.int64)) % loop_total[face]
+    return rotation
+
+
+def align_corners(src, mesh, vert_map, face_map):
+    """Rotation of every mesh polygon that makes its corner at vert matched to first vert of matched src polygon
+    its first corner, so corners (and loop attributes) of matched polygons line up with src"""
+    if not len(src.loop_start):
+        return np.zeros(len(mesh.loop_total), dtype=np.int64)
+    faces, _ = loop_faces(mesh.loop_start, mesh.loop_total)
+    src_faces = face_map[faces]
+    src_first_verts = src.loop_verts[src.loop_start[np.maximum(src_faces, 0)]]
+    loops = np.flatnonzero((src_faces >= 0) & (vert_map[mesh.loop_verts] == src_first_verts))
+    return corner_rotation(mesh.loop_start, mesh.loop_total, loops, np.zeros(len(loops), dtype=np.int64))
+
+
+def topology_fingerprint(edge_verts, loop_total, loop_verts):
+    """Hash of mesh connectivity (positions are ignored)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for data in (edge_verts, loop_total, loop_verts):
+        digest.update(np.ascontiguousarray(data, dtype=np.int32).tobytes())
+    return digest.digest()
+
+
+def face_adjacency(loop_total, loop_edges, edge_count):
+    """(n, 2) array of face pairs sharing manifold edge, and number of faces using each edge"""
+    face_of_loop = np.repeat(np.arange(len(loop_total)), loop_total)
+    edge_faces = np.bincount(loop_edges, minlength=edge_count)
+    order = np.argsort(loop_edges, kind='stable')
+    sorted_edges = loop_edges[order]
+    first = np.flatnonzero((sorted_edges[:-1] == sorted_edges[1:]) & (edge_faces[sorted_edges[:-1]] == 2))
+    pairs = np.stack((face_of_loop[order[first]], face_of_loop[order[first + 1]]), axis=1)
+    return pairs, edge_faces
+
+
+def face_islands(face_count, pairs):
+    """Island label per face (labels are lowest face index of island).
+    Uses scipy connected components when available, numpy hook and compress otherwise"""
+    if connected_components is not None and len(pairs):
+        graph = coo_matrix((np.ones(len(pairs), dtype=np.int8), (pairs[:, 0], pairs[:, 1])), shape=(face_count, face_count))
+        _, components = connected_components(graph, directed=False)
+        lowest = np.full(int(components.max()) + 1, face_count, dtype=np.int64)
+        np.minimum.at(lowest, components, np.arange(face_count))
+        return lowest[components]
+    # every round hooks each root to lowest neighbouring root and compresses labels fully, so every label points
+    # at its root again. Roots that are not local minima get hooked, so number of rounds is logarithmic
+    labels = np.arange(face_count)
+    a, b = pairs[:, 0], pairs[:, 1]
+    while True:
+        root_a, root_b = labels[a], labels[b]
+        differ = root_a != root_b
+        if not differ.any():
+            return labels
+        np.minimum.at(labels, np.maximum(root_a, root_b)[differ], np.minimum(root_a, root_b)[differ])
+        while True:
+            compressed = labels[labels]
+            if np.array_equal(compressed, labels):
+                break
+            labels = compressed
+
+
+def refine_face_colors(loop_total, pairs, rounds=8):
+    """Topology only face colors - iterative neighbourhood refinement starting from face valences.
+    Colors do not depend on element order or shape, so matching topologies give matching colors"""
+    degree = np.bincount(pairs.ravel(), minlength=len(loop_total))
+    colors = _mix64(loop_total.astype(np.int64) * 4096 + degree)
+    a = np.concatenate((pairs[:, 0], pairs[:, 1]))
+    b = np.concatenate((pairs[:, 1], pairs[:, 0]))
+    for _ in range(rounds):
+        neighbours = np.zeros(len(colors), dtype=np.uint64)
+        np.add.at(neighbours, a, _mix64(colors[b]))  # order independent multiset hash
+        colors = _mix64(colors ^ _mix64(neighbours))
+    return colors
+
+
+class MeshIslands():
+    """Face islands of mesh with topology signatures, used to pair islands and seed faces of two meshes"""
+
+    def __init__(self, mesh):
+        loop_total, loop_edges = mesh.loop_total, mesh.loop_edges
+        hidden = np.zeros(len(loop_total), dtype=bool) if mesh.face_hidden is None else np.asarray(mesh.face_hidden, dtype=bool)
+        pairs, edge_faces = face_adjacency(loop_total, loop_edges, len(mesh.edge_verts))
+        pairs = pairs[~hidden[pairs].any(axis=1)]
+
+        order = np.argsort(np.concatenate((pairs[:, 0], pairs[:, 1])), kind='stable')
+        self.neighbours = np.concatenate((pairs[:, 1], pairs[:, 0]))[order]
+        self.neighbour_offsets = np.concatenate(([0], np.cumsum(np.bincount(pairs.ravel(), minlength=len(loop_total)))))
+        self.colors = refine_face_colors(loop_total, pairs)
+        self.centers = face_centers(mesh)
+
+        _, self.island_of_face = np.unique(face_islands(len(loop_total), pairs), return_inverse=True)
+        island_count = int(self.island_of_face.max()) + 1 if len(loop_total) else 0
+        self.island_faces = np.argsort(self.island_of_face, kind='stable')
+        self.island_offsets = np.concatenate(([0], np.cumsum(np.bincount(self.island_of_face, minlength=island_count))))
+        face_counts = np.diff(self.island_offsets)
+
+        self.signatures = np.zeros(island_count, dtype=np.uint64)
+        np.add.at(self.signatures, self.island_of_face, _mix64(self.colors))
+        self.signatures ^= _mix64(face_counts)
+        self.centroids = np.zeros((island_count, 3))
+        np.add.at(self.centroids, self.island_of_face, self.centers)
+        self.centroids /= np.maximum(face_counts, 1)[:, None]
+
+        # hidden islands are skipped by flood fill, non manifold ones can not be flood filled
+        self.usable = np.ones(island_count, dtype=bool)
+        self.usable[self.island_of_face[hidden]] = False
+        non_manifold_loops = edge_faces[loop_edges] > 2
+        self.usable[self.island_of_face[np.repeat(np.arange(len(loop_total)), loop_total)[non_manifold_loops]]] = False
+
+    def faces(self, island):
+        return self.island_faces[self.island_offsets[island]:self.island_offsets[island + 1]]
+
+    def face_neighbours(self, face):
+        return self.neighbours[self.neighbour_offsets[face]:self.neighbour_offsets[face + 1]]
+
+
+def match_islands(src_islands, islands):
+    """[(source island, target island)] with equal topology signature.
+    Islands sharing signature (copies, symmetric parts) are paired by nearest centroid"""
+    island_pairs = []
+    src_usable = np.flatnonzero(src_islands.usable)
+    usable = np.flatnonzero(islands.usable)
+    for signature in np.unique(islands.signatures[usable]):
+        src_group = src_usable[src_islands.signatures[src_usable] == signature]
+        group = usable[islands.signatures[usable] == signature]
+        if not len(src_group):
+            continue
+        if len(src_group) == 1 and len(group) == 1:
+            island_pairs.append((int(src_group[0]), int(group[0])))
+            continue
+        dist = np.linalg.norm(islands.centroids[group][:, None] - src_islands.centroids[src_group][None], axis=2)
+        src_used = set()
+        used = set()
+        for flat in np.argsort(dist, axis=None).tolist():
+            i, j = divmod(flat, len(src_group))
+            if i in used or j in src_used:
+                continue
+            used.add(i)
+            src_used.add(j)
+            island_pairs.append((int(src_group[j]), int(group[i])))
+            if len(used) == min(len(group), len(src_group)):
+                break
+    return island_pairs
+
+
+def _single_edge_neighbours(islands, face):
+    """Neighbours of face sharing exactly one manifold edge with it - only such pairs can seed flood_fill"""
+    neighbours, counts = np.unique(islands.face_neighbours(face), return_counts=True)
+    return neighbours[counts == 1].tolist()
+
+
+def seed_face_candidates(src_islands, src_island, islands, island):
+    """Yield ((source face, its neighbour), (target face, its neighbour)) to start flood fill from, best first.
+    Seeds are faces of rarest colors in island, paired with a neighbour sharing one edge. When several target
+    candidates fit (symmetric islands) the ones with closest position relative to island centroid come first"""
+    src_faces = src_islands.faces(src_island)
+    colors, counts = np.unique(src_islands.colors[src_faces], return_counts=True)
+    island_color_count = dict(zip(colors.tolist(), counts.tolist()))
+    faces = islands.faces(island)
+    for color in colors[np.argsort(counts, kind='stable')].tolist():
+        src_seeds = ((face, _single_edge_neighbours(src_islands, face)) for face in src_faces[src_islands.colors[src_faces] == np.uint64(color)].tolist())
+        src_face, src_next_faces = next(((face, next_faces) for face, next_faces in src_seeds if next_faces), (None, None))
+        if src_face is None:
+            continue
+        src_next = int(min(src_next_faces, key=lambda f: (island_color_count[int(src_islands.colors[f])], f)))
+        next_color = src_islands.colors[src_next]
+        src_offset = src_islands.centers[src_face] - src_islands.centroids[src_island]
+        src_next_offset = src_islands.centers[src_next] - src_islands.centers[src_face]
+
+        candidates = []
+        for face in faces[islands.colors[faces] == np.uint64(color)].tolist():
+            for next_face in _single_edge_neighbours(islands, face):
+                if islands.colors[next_face] == next_color:
+                    offset = islands.centers[face] - islands.centroids[island]
+                    next_offset = islands.centers[next_face] - islands.centers[face]
+                    score = np.linalg.norm(offset - src_offset) + np.linalg.norm(next_offset - src_next_offset)
+                    candidates.append((score, face, next_face))
+        for _, face, next_face in sorted(candidates):
+            yield (src_face, src_next), (face, next_face)
+
+
+def _build(kind, build, *arrays):
+    return build()
+
+
+def proximity_indices(src, derive_from_verts=False, cache=None):
+    """Search indices of src MeshArrays for proximity_match_steps. Edge and face indices are left out
+    with derive_from_verts. cache(kind, build, *arrays) may return index built before from same arrays"""
+    cache = cache or _build
+    indices = {'VERTS': cache('VERTS', lambda: SpatialIndex(src.co), src.co)}
+    if not derive_from_verts:
+        indices['EDGES'] = cache('EDGES', lambda: SpatialIndex(edge_midpoints(src.co, src.edge_verts)), src.co, src.edge_verts)
+        indices['FACES'] = face_center_index(src, cache)
+    return indices
+
+
+def face_center_index(src, cache=None):
+    """SpatialIndex of src face centers, shared with proximity_indices through cache"""
+    return (cache or _build)('FACES', lambda: SpatialIndex(face_centers(src)), src.co, src.loop_total, src.loop_verts)
+
+
+def proximity_match_steps(src, indices, mesh, delta, workers=-1, chunk_size=0, candidates=0, predicted=None):
+    """Step generator matching elements of mesh to nearest src elements within delta (one query chunk per step).
+    Returns (vert_map, edge_map, face_map, rotation). Without edge/face indices they are derived from matched verts.
+    Corners of matched faces are aligned by matched verts (see align_corners).
+    candidates > 0 makes the match one to one (see match_unique_steps), otherwise elements may share source element.
+    predicted - (vert_map, edge_map, face_map) expected for mesh, e.g. match of previous frame of a sequence with the
+    same element order. Predicted pairs still within delta are kept and only the rest is searched"""
+    def search_steps(src_index, points):
+        if candidates:
+            return match_unique_steps(src_index, points, delta, candidates, workers, chunk_size)
+        return match_nearest_steps(src_index, points, delta, workers, chunk_size)
+
+    def match_steps(src_index, points, kind):
+        if predicted is None:
+            return search_steps(src_index, points)
+        return match_predicted_steps(src_index, points, delta, predicted[kind], search_steps, candidates > 0)
+
+    # batched queries on whole arrays - target index i maps to source index or -1 if not within delta
+    with profiler.stage("query verts", len(mesh.co)):
+        vert_map = yield from scaled_steps(match_steps(indices['VERTS'], mesh.co, 0), 0.0, 0.4)
+    if 'EDGES' not in indices:
+        with profiler.stage("derive edges/faces", len(mesh.edge_verts) + len(mesh.loop_total)):
+            edge_map = derive_edge_map(vert_map, mesh.edge_verts, src.edge_verts, len(src.co))
+            face_map = derive_face_map(vert_map, (mesh.loop_start, mesh.loop_total, mesh.loop_verts), (src.loop_start, src.loop_total, src.loop_verts))
+    else:
+        with profiler.stage("query edges", len(mesh.edge_verts)):
+            edge_map = yield from scaled_steps(match_steps(indices['EDGES'], edge_midpoints(mesh.co, mesh.edge_verts), 1), 0.4, 0.8)
+        with profiler.stage("query faces", len(mesh.loop_total)):
+            face_map = yield from scaled_steps(match_steps(indices['FACES'], face_centers(mesh), 2), 0.8, 1.0)
+    with profiler.stage("align corners", len(mesh.loop_verts)):
+        rotation = align_corners(src, mesh, vert_map, face_map)
+    return vert_map, edge_map, face_map, rotation
+
+
+def match_by_proximity(src, mesh, delta=0.1, derive_from_verts=False, candidates=0, predicted=None):
+    """(vert_map, edge_map, face_map, rotation) of mesh matched to src MeshArrays by element positions"""
+    return run_steps(proximity_match_steps(src, proximity_indices(src, derive_from_verts), mesh, delta, candidates=candidates, predicted=predicted))
+
+
+def uv_indices(src, uv_precision=0.00001, cache=None):
+    """UV center index and exact UV face hashes of src MeshArrays for uv_match_steps (same uv_precision)"""
+    cache = cache or _build
+    indices = {'UV_CENTERS': cache('UV_CENTERS', lambda: SpatialIndex(face_uv_centers(src)), src.loop_total, src.uvs)}
+    if uv_precision > 0:
+        indices['UV_HASHES'] = cache(('UV_HASHES', uv_precision), lambda: uv_face_hashes(src, uv_precision), src.loop_total, src.uvs)
+    return indices
+
+
+def uv_match_steps(src, indices, mesh, delta, uv_precision=0.00001, workers=-1, chunk_size=0):
+    """Step generator matching faces of mesh to src faces by UVs, returns (vert_map, edge_map, face_map, rotation).
+    Faces with same quantized UV corner sequence are matched exactly (and corner rotation is aligned),
+    remaining faces by nearest UV center within delta"""
+    face_map, loops, src_loops, src_corners = yield from uv_corner_pairs_steps(src, indices, mesh, delta, uv_precision, workers, chunk_size)
+    # matched faces pass their loop verts/edges on, corner by corner (starting at aligned first corner).
+    # -1 = not matched. Later faces overwrite ids of verts/edges shared with earlier faces, like before
+    vert_map = np.full(len(mesh.co), -1, dtype=np.int64)
+    edge_map = np.full(len(mesh.edge_verts), -1, dtype=np.int64)
+    vert_map[mesh.loop_verts[loops]] = src.loop_verts[src_loops]
+    edge_map[mesh.loop_edges[loops]] = src.loop_edges[src_loops]
+    rotation = corner_rotation(mesh.loop_start, mesh.loop_total, loops, src_corners)
+    return vert_map, edge_map, face_map, rotation
+
+
+def uv_corner_pairs_steps(src, indices, mesh, delta, uv_precision=0.00001, workers=-1, chunk_size=0):
+    """Step generator of uv_match_steps face matching, only needs loop start/total and uvs of mesh.
+    Returns (face_map, loops, src_loops, src_corners) - corresponding corners of matched faces, src_corners
+    is position of src loop inside its face"""
+    loop_start, loop_total = mesh.loop_start, mesh.loop_total
+    face_map = np.full(len(loop_total), -1, dtype=np.int64)
+    rotation = np.zeros(len(loop_total), dtype=np.int64)
+    src_offset = np.zeros(len(loop_total), dtype=np.int64)
+    if uv_precision > 0:
+        src_hashes, src_rotation = indices['UV_HASHES']
+        with profiler.stage("uv hash join", len(loop_total)):
+            face_map, rotation = match_uv_faces_exact(mesh, src, src_hashes, src_rotation, uv_precision)
+        hashed = face_map >= 0
+        src_offset[hashed] = src_rotation[face_map[hashed]]
+        yield 0.3
+    rest = np.flatnonzero(face_map < 0)
+    if len(rest):
+        with profiler.stage("query uv centers", len(rest)):
+            face_map[rest] = yield from scaled_steps(match_nearest_steps(indices['UV_CENTERS'], face_uv_centers(mesh)[rest], delta, workers, chunk_size), 0.3, 0.9)
+
+    matched = np.flatnonzero(face_map >= 0)
+    src_matched = face_map[matched]
+    corners = np.minimum(loop_total[matched], src.loop_total[src_matched])
+    ramp = np.arange(int(corners.sum())) - np.repeat(np.cumsum(corners) - corners, corners)
+    loops = np.repeat(loop_start[matched], corners) + (np.repeat(rotation[matched], corners) + ramp) % np.repeat(loop_total[matched], corners)
+    src_corners = (np.repeat(src_offset[matched], corners) + ramp) % np.repeat(src.loop_total[src_matched], corners)
+    src_loops = np.repeat(src.loop_start[src_matched], corners) + src_corners
+    return face_map, loops, src_loops, src_corners
+
+
+def match_by_uv(src, mesh, delta=0.01, uv_precision=0.00001):
+    """(vert_map, edge_map, face_map, rotation) of mesh matched to src MeshArrays by face UVs"""
+    return run_steps(uv_match_steps(src, uv_indices(src, uv_precision), mesh, delta, uv_precision))
+
+
+def topology_match(src, src_islands, src_graph, mesh, islands, graph, reporter=None, max_seed_attempts=8):
+    """Match mesh to src by flood filling every pair of islands with equal topology from automatically picked seeds.
+    Up to max_seed_attempts seeds are tried per island. Flood fill problems of islands that could not be matched
+    are passed to reporter.report(type, message) if given.
+    Returns (vert_map, edge_map, face_map, rotation, number of islands that could not be matched)"""
+    vert_map = np.full(len(mesh.co), -1, dtype=np.int64)
+    edge_map = np.full(len(mesh.edge_verts), -1, dtype=np.int64)
+    face_map = np.full(len(mesh.loop_total), -1, dtype=np.int64)
+    island_pairs = match_islands(src_islands, islands)
+    skipped = 0
+    loops, src_loops = [], []
+    for src_island, island in island_pairs:
+        # next seed candidate is tried when flood fill fails or parses faces differently (wrong symmetric seed)
+        error = None
+        for (src_face, src_next), (face, next_face) in islice(seed_face_candidates(src_islands, src_island, islands, island), max_seed_attempts):
+            try:
+                src_parsed = flood_fill(src, src_graph, src_face, src_next)
+                parsed = flood_fill(mesh, graph, face, next_face)
+            except FloodFillError as e:
+                error = e
+                continue
+            if src_parsed.offsets == parsed.offsets:
+                break
+        else:
+            if reporter and error is not None:
+                reporter.report({'WARNING'}, str(error))
+            skipped += 1
+            continue
+        face_map[np.frombuffer(parsed.faces, dtype=np.int32)] = np.frombuffer(src_parsed.faces, dtype=np.int32)
+        vert_map[np.frombuffer(parsed.verts, dtype=np.int32)] = np.frombuffer(src_parsed.verts, dtype=np.int32)
+        edge_map[np.frombuffer(parsed.edges, dtype=np.int32)] = np.frombuffer(src_parsed.edges, dtype=np.int32)
+        loops.append(np.frombuffer(parsed.loops, dtype=np.int32))
+        src_loops.append(np.frombuffer(src_parsed.loops, dtype=np.int32))
+    # parsed faces of both meshes start at corresponding loops
+    src_corners = loop_faces(src.loop_start, src.loop_total)[1][np.concatenate(src_loops)] if src_loops else []
+    rotation = corner_rotation(mesh.loop_start, mesh.loop_total, np.concatenate(loops) if loops else [], src_corners)
+    unmatched = int(islands.usable.sum()) - len(island_pairs) + skipped
+    return vert_map, edge_map, face_map, rotation, unmatched
+
+
+def match_by_topology(src, mesh):
+    """(vert_map, edge_map, face_map, rotation, unmatched islands) of mesh matched to src MeshArrays by topology"""
+    return topology_match(src, MeshIslands(src), LoopGraph(src), mesh, MeshIslands(mesh), LoopGraph(mesh))
+
+
+def pick_anchors(src, src_islands, src_face_index, mesh, islands, delta, max_anchors=8):
+    """High confidence face pairs to seed anchored_fill: (target faces, source faces, corner offsets).
+    Anchor is mutual nearest face pair with centers well inside delta (delta / 2), same corner count and topology color,
+    whose corners line up within delta when target corner (k + offset) is paired with source corner k.
+    Up to max_anchors per target island, best one first and the rest spread out by farthest point sampling"""
+    near = delta * 0.5
+    found = match_nearest(src_face_index, islands.centers, near)
+    faces = np.flatnonzero(found >= 0)
+    src_faces = found[faces]
+    back = match_nearest(SpatialIndex(islands.centers), src_islands.centers[src_faces], near)
+    keep = ((back == faces) & (mesh.loop_total[faces] == src.loop_total[src_faces])
+            & (islands.colors[faces] == src_islands.colors[src_faces]) & islands.usable[islands.island_of_face[faces]])
+    faces, src_faces = faces[keep], src_faces[keep]
+
+    # best corner offset of every candidate, per corner count
+    offsets = np.zeros(len(faces), dtype=np.int64)
+    errors = np.full(len(faces), np.inf)
+    for total in np.unique(mesh.loop_total[faces]).tolist():
+        group = np.flatnonzero(mesh.loop_total[faces] == total)
+        corners = np.arange(total)
+        co = mesh.co[mesh.loop_verts[mesh.loop_start[faces[group]][:, None] + corners]].astype(np.float64)
+        src_co = src.co[src.loop_verts[src.loop_start[src_faces[group]][:, None] + corners]].astype(np.float64)
+        for offset in range(total):
+            error = np.linalg.norm(np.roll(co, -offset, axis=1) - src_co, axis=2).max(axis=1)
+            better = error < errors[group]
+            errors[group[better]] = error[better]
+            offsets[group[better]] = offset
+    keep = errors < delta
+    faces, src_faces, offsets, errors = faces[keep], src_faces[keep], offsets[keep], errors[keep]
+
+    chosen = []
+    island_of = islands.island_of_face[faces]
+    for island in np.unique(island_of).tolist():
+        members = np.flatnonzero(island_of == island)
+        members = members[np.argsort(errors[members], kind='stable')]
+        centers = islands.centers[faces[members]]
+        picked = [0]
+        dist = np.linalg.norm(centers - centers[0], axis=1)
+        while len(picked) < min(max_anchors, len(members)) and dist.max() > 0:
+            picked.append(int(np.argmax(dist)))
+            dist = np.minimum(dist, np.linalg.norm(centers - centers[picked[-1]], axis=1))
+        chosen.extend(members[picked].tolist())
+    return faces[chosen], src_faces[chosen], offsets[chosen]
+
+
+def anchored_fill(src_graph, graph, anchors, face_count=None):
+    """Flood fill both meshes in lockstep from all anchors at once, breadth first - like flood_fill, but every parsed
+    target face carries its source face along, so fronts of many seeds stay short. Faces reached by two fronts
+    (or with different topology around them) are not parsed again, disagreements are counted as conflicts.
+    Stops as soon as face_count faces are parsed. Returns (src ParsedFaces, ParsedFaces, conflicts), faces in same order"""
+    src_parsed, parsed = ParsedFaces(), ParsedFaces()
+    matched = [-1] * len(graph.loop_total)
+    src_used = bytearray(len(src_graph.loop_total))
+    face_count = len(graph.loop_total) if face_count is None else face_count
+    conflicts = 0
+
+    faces_to_parse = []
+    for face, src_face, offset in zip(*(np.asarray(values).tolist() for values in anchors)):
+        if matched[face] >= 0 or src_used[src_face]:
+            continue
+        total, start = graph.loop_total[face], graph.loop_start[face]
+        face_loops = [start + (offset + k) % total for k in range(total)]
+        src_loops = list(src_graph.face_loops(src_face))
+        parsed.add_face(graph, face, face_loops, True)
+        src_parsed.add_face(src_graph, src_face, src_loops, True)
+        matched[face] = src_face
+        src_used[src_face] = 1
+        faces_to_parse.append((face_loops, True, src_loops, True))
+
+    verts, prev, radial, face_of, hidden = graph.verts, graph.prev, graph.radial, graph.face, graph.hidden
+    src_verts, src_prev, src_radial, src_face_of = src_graph.verts, src_graph.prev, src_graph.radial, src_graph.face
+    while faces_to_parse and len(parsed) < face_count:
+        new_parsed_faces = []
+        for face_loops, forward, src_loops, src_forward in faces_to_parse:
+            last = len(face_loops) - 1
+            for i, (loop, src_loop) in enumerate(zip(face_loops, src_loops)):
+                radial_loop = radial[loop if forward else prev[loop]]
+                src_radial_loop = src_radial[src_loop if src_forward else src_prev[src_loop]]
+                if radial_loop < 0 or src_radial_loop < 0:
+                    conflicts += radial_loop != src_radial_loop  # boundary or non manifold on one side only
+                    continue
+                shared_face, src_shared_face = face_of[radial_loop], src_face_of[src_radial_loop]
+                if matched[shared_face] >= 0:
+                    conflicts += matched[shared_face] != src_shared_face
+                    continue
+                if hidden and hidden[shared_face]:
+                    continue
+                if src_used[src_shared_face] or graph.loop_total[shared_face] != src_graph.loop_total[src_shared_face]:
+                    conflicts += 1
+                    continue
+                vert1 = verts[face_loops[0]] if i == last else verts[loop]
+                src_vert1 = src_verts[src_loops[0]] if i == last else src_verts[src_loop]
+                shared_loops, shared_forward = graph.ordered_loops(radial_loop, vert1)
+                src_shared_loops, src_shared_forward = src_graph.ordered_loops(src_radial_loop, src_vert1)
+                parsed.add_face(graph, shared_face, shared_loops, shared_forward)
+                src_parsed.add_face(src_graph, src_shared_face, src_shared_loops, src_shared_forward)
+                matched[shared_face] = src_shared_face
+                src_used[src_shared_face] = 1
+                new_parsed_faces.append((shared_loops, shared_forward, src_shared_loops, src_shared_forward))
+        faces_to_parse = new_parsed_faces
+    return src_parsed, parsed, conflicts
+
+
+def hybrid_match(src, src_islands, src_graph, src_face_index, mesh, islands, graph, delta, max_anchors=8, reporter=None):
+    """Match mesh to src by topology, seeded from proximity anchors (see pick_anchors) on every island - no seed
+    selection needed and shapes may differ away from anchors. Conflicts between fronts are passed to reporter.
+    Returns (vert_map, edge_map, face_map, rotation, number of islands without anchor)"""
+    anchors = pick_anchors(src, src_islands, src_face_index, mesh, islands, delta, max_anchors)
+    anchored_islands = np.unique(islands.island_of_face[anchors[0]])
+    face_count = int(np.diff(islands.island_offsets)[anchored_islands].sum())
+    src_parsed, parsed, conflicts = anchored_fill(src_graph, graph, anchors, face_count)
+    if conflicts and reporter:
+        reporter.report({'WARNING'}, str(conflicts)+" faces reached from different anchors did not agree")
+
+    vert_map = np.full(len(mesh.co), -1, dtype=np.int64)
+    edge_map = np.full(len(mesh.edge_verts), -1, dtype=np.int64)
+    face_map = np.full(len(mesh.loop_total), -1, dtype=np.int64)
+    face_map[np.frombuffer(parsed.faces, dtype=np.int32)] = np.frombuffer(src_parsed.faces, dtype=np.int32)
+    vert_map[np.frombuffer(parsed.verts, dtype=np.int32)] = np.frombuffer(src_parsed.verts, dtype=np.int32)
+    edge_map[np.frombuffer(parsed.edges, dtype=np.int32)] = np.frombuffer(src_parsed.edges, dtype=np.int32)
+    src_corners = loop_faces(src.loop_start, src.loop_total)[1][np.frombuffer(src_parsed.loops, dtype=np.int32)]
+    rotation = corner_rotation(mesh.loop_start, mesh.loop_total, np.frombuffer(parsed.loops, dtype=np.int32), src_corners)
+    unmatched = int(islands.usable.sum()) - len(anchored_islands)
+    return vert_map, edge_map, face_map, rotation, unmatched
+
+
+def match_by_hybrid(src, mesh, delta=0.1, max_anchors=8):
+    """(vert_map, edge_map, face_map, rotation, islands without anchor) of mesh matched to src MeshArrays by topology
+    propagated from proximity anchors"""
+    return hybrid_match(src, MeshIslands(src), LoopGraph(src), face_center_index(src),
+                        mesh, MeshIslands(mesh), LoopGraph(mesh), delta, max_anchors)
+
+
+VerifyReport = namedtuple("VerifyReport", "counts src_counts verts edges faces mismatched_islands")
+VerifyReport.__doc__ = """Element by element comparison of target with source - counts/src_counts are (verts, edges, faces),
+verts/edges/faces are numbers of elements equal to source element with same index (same neighbour verts,
+same vert pair, same vert sequence starting at same corner), mismatched_islands is [(island, differing faces, faces)]
+of target face islands (numbered in order of their lowest face) touching any differing element"""
+
+
+def _vert_neighbourhoods(vert_count, edge_verts):
+    """Order independent hash of neighbour verts of every vert"""
+    hashes = np.zeros(vert_count, dtype=np.uint64)
+    a, b = edge_verts[:, 0], edge_verts[:, 1]
+    np.add.at(hashes, a, _mix64(b.astype(np.int64)))
+    np.add.at(hashes, b, _mix64(a.astype(np.int64)))
+    return hashes
+
+
+def verify_topology(src, mesh):
+    """VerifyReport of mesh compared to src MeshArrays. Only elements with index present in both meshes are compared"""
+    vert_count, edge_count, face_count = (min(len(src.co), len(mesh.co)), min(len(src.edge_verts), len(mesh.edge_verts)),
+                                          min(len(src.loop_total), len(mesh.loop_total)))
+    vert_ok = np.zeros(len(mesh.co), dtype=bool)
+    edge_ok = np.zeros(len(mesh.edge_verts), dtype=bool)
+    face_ok = np.zeros(len(mesh.loop_total), dtype=bool)
+
+    vert_ok[:vert_count] = (_vert_neighbourhoods(len(src.co), src.edge_verts)[:vert_count]
+                            == _vert_neighbourhoods(len(mesh.co), mesh.edge_verts)[:vert_count])
+    edge_ok[:edge_count] = (np.sort(src.edge_verts[:edge_count], axis=1) == np.sort(mesh.edge_verts[:edge_count], axis=1)).all(axis=1)
+
+    # faces with same corner count are compared corner by corner
+    loop_total = mesh.loop_total[:face_count]
+    same_total = np.flatnonzero(loop_total == src.loop_total[:face_count])
+    totals = loop_total[same_total]
+    offsets = np.arange(int(totals.sum())) - np.repeat(np.cumsum(totals) - totals, totals)
+    loops = np.repeat(mesh.loop_start[same_total], totals) + offsets
+    src_loops = np.repeat(src.loop_start[same_total], totals) + offsets
+    differing = np.bincount(np.repeat(np.arange(len(same_total)), totals), mesh.loop_verts[loops] != src.loop_verts[src_loops],
+                            minlength=len(same_total))
+    face_ok[same_total[differing == 0]] = True
+
+    mismatched_islands = []
+    if not (vert_ok.all() and edge_ok.all() and face_ok.all()):
+        # face differs if its corners, verts or edges differ
+        face_of_loop = np.repeat(np.arange(len(mesh.loop_total)), mesh.loop_total)
+        bad_loops = ~vert_ok[mesh.loop_verts] | ~edge_ok[mesh.loop_edges]
+        face_bad = ~face_ok | (np.bincount(face_of_loop[bad_loops], minlength=len(mesh.loop_total)) > 0)
+        island_of_face = island_numbers(mesh)
+        island_count = int(island_of_face.max()) + 1 if len(island_of_face) else 0
+        bad_counts = np.bincount(island_of_face[face_bad], minlength=island_count)
+        face_counts = np.bincount(island_of_face, minlength=island_count)
+        mismatched_islands = [(int(island), int(bad_counts[island]), int(face_counts[island])) for island in np.flatnonzero(bad_counts)]
+
+    return VerifyReport((len(mesh.co), len(mesh.edge_verts), len(mesh.loop_total)),
+                        (len(src.co), len(src.edge_verts), len(src.loop_total)),
+                        int(np.count_nonzero(vert_ok)), int(np.count_nonzero(edge_ok)), int(np.count_nonzero(face_ok)),
+                        mismatched_islands)
+
+
+def verify_percentages(report):
+    """(verts, edges, faces) percentage of equal elements, relative to larger of source/target count"""
+    return tuple(100.0 * equal / max(count, src_count) if max(count, src_count) else 100.0
+                 for equal, count, src_count in zip((report.verts, report.edges, report.faces), report.counts, report.src_counts))
+
+
+def verify_summary_lines(report, max_islands=10):
+    """Human readable lines of VerifyReport, first line is overall result"""
+    percentages = verify_percentages(report)
+    exact = all(percentage == 100.0 for percentage in percentages)
+    lines = [("Topology matches source exactly" if exact else "Topology differs from source")
+             + " - verts {:.2f}%, edges {:.2f}%, faces {:.2f}%".format(*percentages)]
+    if report.counts != report.src_counts:
+        lines.append("Element counts differ: target {} / source {} (verts, edges, faces)".format(report.counts, report.src_counts))
+    for island, differing, faces in report.mismatched_islands[:max_islands]:
+        lines.append("Island {}: {} of {} faces differ".format(island, differing, faces))
+    if len(report.mismatched_islands) > max_islands:
+        lines.append("... {} more differing islands".format(len(report.mismatched_islands) - max_islands))
+    return lines
+
+
+def island_numbers(mesh):
+    """Island number of every face of MeshArrays, islands are numbered in order of their lowest face"""
+    pairs, _ = face_adjacency(mesh.loop_total, mesh.loop_edges, len(mesh.edge_verts))
+    return np.unique(face_islands(len(mesh.loop_total), pairs), return_inverse=True)[1].ravel()
+
+
+Region = namedtuple("Region", "verts edges faces")
+Region.__doc__ = "Sorted vert/edge/face indices of the part of a mesh a scoped transfer may reorder (see region_mesh)"
+
+
+def region_from_faces(mesh, faces):
+    """Region of faces of MeshArrays with verts and edges of their corners"""
+    faces = np.unique(np.asarray(faces, dtype=np.int64))
+    totals = mesh.loop_total[faces]
+    loops = np.repeat(mesh.loop_start[faces], totals) + np.arange(int(totals.sum())) - np.repeat(np.cumsum(totals) - totals, totals)
+    return Region(np.unique(mesh.loop_verts[loops]), np.unique(mesh.loop_edges[loops]), faces)
+
+
+def region_mesh(mesh, region):
+    """MeshArrays of region only - region elements renumbered 0..n in region order, so every match function
+    runs on region alone and returns index maps of region elements (see scoped_index_map)"""
+    totals = mesh.loop_total[region.faces]
+    starts = np.cumsum(totals) - totals
+    loops = np.repeat(mesh.loop_start[region.faces], totals) + np.arange(int(totals.sum())) - np.repeat(starts, totals)
+    return MeshArrays(mesh.co[region.verts], np.searchsorted(region.verts, mesh.edge_verts[region.edges]).astype(np.int32),
+                      starts.astype(np.int32), totals, np.searchsorted(region.verts, mesh.loop_verts[loops]).astype(np.int32),
+                      np.searchsorted(region.edges, mesh.loop_edges[loops]).astype(np.int32),
+                      None if mesh.face_hidden is None else mesh.face_hidden[region.faces],
+                      None if mesh.uvs is None else mesh.uvs[loops])
+
+
+def scoped_index_map(id_map, region_ids, count):
+    """Permutation of range(count) from ids matched for region_ids elements (-1 = not matched).
+    Region elements only move between indices of the region - matched element takes its source index if that
+    index belongs to region, everything outside of region keeps its index"""
+    ids = np.arange(count)
+    if not len(region_ids):
+        return ids
+    id_map = np.asarray(id_map, dtype=np.int64)
+    slots = np.minimum(np.searchsorted(region_ids, id_map), len(region_ids) - 1)
+    matched = (id_map >= 0) & (region_ids[slots] == id_map)
+    ids[region_ids] = region_ids[repair_index_map(np.where(matched, slots, np.arange(len(region_ids))), matched)]
+    return ids
+
+
+# float64 query points, kd tree query results and temporaries of one element in a streamed query chunk
+STREAM_BYTES_PER_ELEMENT = 160
+
+
+def stream_resident_bytes(vert_count, edge_count, face_count, loop_count, uvs=False, candidates=0):
+    """Estimated bytes streamed matching keeps for whole target - read arrays and int32 maps, and with candidates
+    (one to one) distance and index of candidates of each element of the largest kind"""
+    size = vert_count * (12 + 4) + edge_count * (8 + 4) + face_count * (8 + 4 + 4) + loop_count * 4
+    if uvs:
+        size += loop_count * (8 + 4)
+    return size + max(vert_count, edge_count, face_count) * candidates * (8 + 8)
+
+
+def indices_nbytes(indices):
+    """Approximate memory of search indices dict (proximity_indices, uv_indices)"""
+    return sum(_cached_nbytes(index) for index in indices.values())
+
+
+def stream_chunk_size(max_bytes, resident_bytes, bytes_per_element=STREAM_BYTES_PER_ELEMENT, min_chunk=4096):
+    """Number of elements queried at once, so resident arrays and one query chunk fit into max_bytes.
+    Never less than min_chunk - check stream_min_bytes to know whether max_bytes can be met"""
+    return max(min_chunk, int((max_bytes - resident_bytes) // bytes_per_element))
+
+
+def stream_min_bytes(resident_bytes, bytes_per_element=STREAM_BYTES_PER_ELEMENT, min_chunk=4096, write_back_bytes=0):
+    """Smallest memory limit streamed matching can stay within - resident arrays and smallest query chunk,
+    or what writing the order back needs (write_back_bytes) when that is more"""
+    return max(resident_bytes + min_chunk * bytes_per_element, write_back_bytes)
+
+
+def reorder_nbytes(vert_count, edge_count, face_count, loop_count, layer_nbytes=0):
+    """Estimated peak bytes of writing new order back to a mesh one layer at a time (addon reorder_mesh) -
+    int64 ids and inverse maps, topology arrays, and largest layer (layer_nbytes) with its permuted copy"""
+    maps = (vert_count + edge_count + face_count) * 16 + loop_count * 8
+    topology = edge_count * (8 + 8) + face_count * (4 + 4 + 8) + loop_count * (4 + 4 + 8 + 4)
+    return maps + topology + 2 * layer_nbytes
+
+
+class MemoryMeter():
+    """Peak memory inside with block - traced allocations (tracemalloc, numpy buffers are traced) plus extra_bytes
+    held from before or allocated outside of python (kd trees). Does not restart tracing already started by someone else"""
+
+    def __init__(self, extra_bytes=0):
+        self.extra_bytes = extra_bytes
+        self.peak = None
+
+    def __enter__(self):
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self._base = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *exc_info):
+        self.peak = max(0, tracemalloc.get_traced_memory()[1] - self._base) + self.extra_bytes
+        if self._started:
+            tracemalloc.stop()
+
+
+def _stream_search(src_index, count, points, delta, chunk_size, workers, predicted=None, candidates=0):
+    """Step generator querying points(start, stop) chunk by chunk, returns int32 index map. Predicted matches
+    within delta are kept (see match_predicted_steps). candidates > 0 keeps that many nearest source points of
+    each chunk and assigns them one to one at the end (see match_unique_steps)"""
+    if candidates:
+        dist = np.empty((count, candidates))
+        found = np.empty((count, candidates), dtype=np.int64)
+    else:
+        index = np.empty(count, dtype=np.int32)
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        if candidates:
+            dist[start:stop], found[start:stop] = src_index.query_k(points(start, stop), candidates, delta, workers)
+            yield 0.9 * stop / count
+            continue
+        if predicted is None:
+            steps = match_nearest_steps(src_index, points(start, stop), delta, workers)
+        else:
+            steps = match_predicted_steps(src_index, points(start, stop), delta, predicted[start:stop],
+                                          lambda src_index, points: match_nearest_steps(src_index, points, delta, workers))
+        index[start:stop] = run_steps(steps)
+        yield stop / count
+    if candidates:
+        return assign_one_to_one(dist, found, len(src_index)).astype(np.int32)
+    return index
+
+
+def _chunk_loops(loop_start, loop_total):
+    """Loop indices of a range of faces, and corner of each of them"""
+    corners = np.arange(int(loop_total.sum())) - np.repeat(np.cumsum(loop_total) - loop_total, loop_total)
+    return np.repeat(loop_start, loop_total) + corners, corners
+
+
+def proximity_stream_steps(src, indices, read, delta, chunk_size, workers=-1, candidates=0, predicted=None):
+    """Memory bounded proximity_match_steps for huge meshes. Target arrays come from read(name) ('co', 'edge_verts',
+    'loop_start', 'loop_total', 'loop_verts') only when a stage needs them. Edge midpoints and face centers are computed
+    and queried chunk_size elements at a time, only int32 maps are kept between chunks.
+    candidates > 0 (one to one) needs candidate arrays of all elements for global assignment.
+    Returns (vert_map, edge_map, face_map, rotation)"""
+    def search_steps(src_index, count, points, kind):
+        found = yield from _stream_search(src_index, count, points, delta, chunk_size, workers,
+                                          None if predicted is None or candidates else predicted[kind], candidates)
+        return found
+
+    co = read('co')
+    with profiler.stage("query verts", len(co)):
+        vert_map = yield from scaled_steps(search_steps(indices['VERTS'], len(co), lambda start, stop: co[start:stop], 0), 0.0, 0.3)
+    edge_verts = read('edge_verts')
+    loop_start, loop_total, loop_verts = read('loop_start'), read('loop_total'), read('loop_verts')
+    if 'EDGES' not in indices:
+        with profiler.stage("derive edges/faces", len(edge_verts) + len(loop_total)):
+            edge_map = derive_edge_map(vert_map, edge_verts, src.edge_verts, len(src.co)).astype(np.int32)
+            face_map = derive_face_map(vert_map, (loop_start, loop_total, loop_verts), (src.loop_start, src.loop_total, src.loop_verts)).astype(np.int32)
+    else:
+        with profiler.stage("query edges", len(edge_verts)):
+            edge_map = yield from scaled_steps(search_steps(indices['EDGES'], len(edge_verts), lambda start, stop: edge_midpoints(co, edge_verts[start:stop]), 1), 0.3, 0.6)
+
+        def centers(start, stop):
+            totals = loop_total[start:stop]
+            loops, _ = _chunk_loops(loop_start[start:stop], totals)
+            return face_centers(MeshArrays(co, None, np.cumsum(totals) - totals, totals, loop_verts[loops], None))
+        with profiler.stage("query faces", len(loop_total)):
+            face_map = yield from scaled_steps(search_steps(indices['FACES'], len(loop_total), centers, 2), 0.6, 0.9)
+    del co, edge_verts
+
+    # corner alignment of align_corners, chunk by chunk of faces
+    rotation = np.zeros(len(loop_total), dtype=np.int32)
+    with profiler.stage("align corners", len(loop_verts)):
+        for start in range(0, len(loop_total), chunk_size):
+            totals = loop_total[start:start + chunk_size]
+            loops, corners = _chunk_loops(loop_start[start:start + chunk_size], totals)
+            faces = np.repeat(np.arange(start, start + len(totals)), totals)
+            src_faces = face_map[faces]
+            src_first_verts = src.loop_verts[src.loop_start[np.maximum(src_faces, 0)]] if len(src.loop_start) else -1
+            hit = (src_faces >= 0) & (vert_map[loop_verts[loops]] == src_first_verts)
+            rotation[faces[hit]] = corners[hit]
+    yield 1.0
+    return vert_map, edge_map, face_map, rotation
+
+
+def uv_stream_steps(src, indices, read, counts, delta, chunk_size, uv_precision=0.00001, workers=-1):
+    """Memory bounded uv_match_steps for huge meshes. Target arrays come from read(name) ('loop_start', 'loop_total',
+    'loop_verts', 'loop_edges', 'uvs'), faces are matched chunk_size at a time. counts - (vert count, edge count).
+    Loops have to be stored in polygon order (whole mesh is one chunk otherwise). Returns int32 (vert_map, edge_map, face_map, rotation)"""
+    loop_start, loop_total = read('loop_start'), read('loop_total')
+    loop_verts, loop_edges, uvs = read('loop_verts'), read('loop_edges'), read('uvs')
+    if not np.array_equal(loop_start, np.cumsum(loop_total) - loop_total):
+        chunk_size = max(len(loop_total), 1)
+    vert_map = np.full(counts[0], -1, dtype=np.int32)
+    edge_map = np.full(counts[1], -1, dtype=np.int32)
+    face_map = np.empty(len(loop_total), dtype=np.int32)
+    rotation = np.empty(len(loop_total), dtype=np.int32)
+    for start in range(0, len(loop_total), chunk_size):
+        totals = loop_total[start:start + chunk_size]
+        first = int(loop_start[start])
+        last = first + int(totals.sum())
+        chunk = MeshArrays(None, None, loop_start[start:start + chunk_size] - first, totals, None, None, None, uvs[first:last])
+        chunk_faces, loops, src_loops, src_corners = run_steps(uv_corner_pairs_steps(src, indices, chunk, delta, uv_precision, workers))
+        face_map[start:start + len(totals)] = chunk_faces
+        vert_map[loop_verts[first + loops]] = src.loop_verts[src_loops]
+        edge_map[loop_edges[first + loops]] = src.loop_edges[src_loops]
+        rotation[start:start + len(totals)] = corner_rotation(chunk.loop_start, totals, loops, src_corners)
+        yield (start + len(totals)) / len(loop_total)
+    return vert_map, edge_map, face_map, rotation